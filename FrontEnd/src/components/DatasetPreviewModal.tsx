@@ -7,6 +7,9 @@ import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import { AlertTriangle, CheckCircle, XCircle, Sparkles, Zap, BarChart3, FileText, History } from 'lucide-react';
 import { toast } from 'sonner';
 
+const CLEAN_POLL_INTERVAL_MS = 2000;
+const CLEAN_POLL_TIMEOUT_MS = 10 * 60 * 1000;
+
 interface DatasetPreviewModalProps {
   isOpen: boolean;
   onClose: () => void;
@@ -119,11 +122,25 @@ export default function DatasetPreviewModal({ isOpen, onClose, dataset }: Datase
   const handleAutoClean = async () => {
     setIsCleaning(true);
     try {
-      await apiClient.autoCleanDataset(dataset!.id, {
+      const { task_id } = await apiClient.autoCleanDataset(dataset!.id, {
         remove_outliers: true,
         fill_missing: true,
         fill_strategy: 'mean'
       });
+      // Cleaning runs on a background worker; poll until it settles or the deadline passes
+      // (an unknown or expired task id reports PENDING forever)
+      const deadline = Date.now() + CLEAN_POLL_TIMEOUT_MS;
+      let status = await apiClient.getCleanStatus(dataset!.id, task_id);
+      while (status.status === 'PENDING' || status.status === 'STARTED' || status.status === 'RETRY') {
+        if (Date.now() >= deadline) {
+          throw new Error('Cleaning did not finish in time');
+        }
+        await new Promise(resolve => setTimeout(resolve, CLEAN_POLL_INTERVAL_MS));
+        status = await apiClient.getCleanStatus(dataset!.id, task_id);
+      }
+      if (status.status !== 'SUCCESS') {
+        throw new Error(status.error || 'Cleaning failed');
+      }
       toast.success('Dataset cleaned successfully!');
       // Refresh data
       await fetchPreviewData();
@@ -132,7 +149,7 @@ export default function DatasetPreviewModal({ isOpen, onClose, dataset }: Datase
         await handleValidate();
       }
     } catch (err) {
-      toast.error('Cleaning failed');
+      toast.error(err instanceof Error ? err.message : 'Cleaning failed');
       console.error(err);
     } finally {
       setIsCleaning(false);
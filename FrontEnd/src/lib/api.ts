@@ -285,12 +285,22 @@ class ApiClient {
   }
 
   async autoCleanDataset(datasetId: string, options?: Record<string, unknown>) {
-    return this.request(`/api/datasets/${datasetId}/clean`, {
+    return this.request<{ task_id: string; dataset_id: string; status: string }>(`/api/datasets/${datasetId}/clean`, {
       method: 'POST',
       body: JSON.stringify({ options }),
     });
   }
 
+  async getCleanStatus(datasetId: string, taskId: string) {
+    return this.request<{
+      task_id: string;
+      dataset_id: string;
+      status: string;
+      result: Record<string, unknown> | null;
+      error: string | null;
+    }>(`/api/datasets/${datasetId}/clean/${taskId}`);
+  }
+
   async getDatasetVersions(datasetId: string) {
     return this.request(`/api/datasets/${datasetId}/versions`);
   }
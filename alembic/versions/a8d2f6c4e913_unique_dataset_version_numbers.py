@@ -0,0 +1,52 @@
+"""Unique index on dataset_versions (dataset_id, version_number)
+
+Revision ID: a8d2f6c4e913
+Revises: f3c9a1e7b205
+Create Date: 2026-10-15 14:22:51.603377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d2f6c4e913'
+down_revision: Union[str, Sequence[str], None] = 'f3c9a1e7b205'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Versions used to be numbered by a racy MAX()+1, so some datasets may hold duplicate
+    # numbers. Renumber those datasets 1..n in creation order before the index goes on.
+    op.execute("""
+        UPDATE dataset_versions
+        SET version_number = renumbered.version_number
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY dataset_id ORDER BY created_at, id) AS version_number
+            FROM dataset_versions
+            WHERE dataset_id IN (
+                SELECT dataset_id
+                FROM dataset_versions
+                GROUP BY dataset_id, version_number
+                HAVING COUNT(*) > 1
+            )
+        ) AS renumbered
+        WHERE dataset_versions.id = renumbered.id
+    """)
+
+    # A unique index rather than a constraint, so SQLite can add it without a table rebuild
+    op.create_index(
+        'ix_dataset_versions_dataset_id_version_number',
+        'dataset_versions',
+        ['dataset_id', 'version_number'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_dataset_versions_dataset_id_version_number', table_name='dataset_versions')
@@ -0,0 +1,40 @@
+"""Add updated_at to users table
+
+Revision ID: c4b7e2d91f3a
+Revises: adc0e65a2b14
+Create Date: 2026-10-15 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4b7e2d91f3a'
+down_revision: Union[str, Sequence[str], None] = 'adc0e65a2b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Track user modifications so admin listings can expose a cheap ETag fingerprint
+    # SQLite cannot add a column with a non-constant default to a table that has rows, so the
+    # column goes in bare, existing users are backfilled, and batch mode (a table rebuild on
+    # SQLite, a plain ALTER elsewhere) attaches the default afterwards
+    op.add_column('users', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE users SET updated_at = created_at")
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column(
+            'updated_at',
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=True,
+            server_default=sa.func.now()
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'updated_at')
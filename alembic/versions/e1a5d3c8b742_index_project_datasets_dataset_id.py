@@ -0,0 +1,30 @@
+"""Index project_datasets.dataset_id
+
+Revision ID: e1a5d3c8b742
+Revises: c4b7e2d91f3a
+Create Date: 2026-10-15 11:03:27.540916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a5d3c8b742'
+down_revision: Union[str, Sequence[str], None] = 'c4b7e2d91f3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The composite primary key (project_id, dataset_id) only serves lookups by project;
+    # dataset-side joins and deletes need their own index
+    op.create_index('ix_project_datasets_dataset_id', 'project_datasets', ['dataset_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_project_datasets_dataset_id', table_name='project_datasets')
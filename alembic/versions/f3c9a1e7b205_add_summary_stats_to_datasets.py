@@ -0,0 +1,32 @@
+"""Add summary_stats_json and summary_stats_version to datasets
+
+Revision ID: f3c9a1e7b205
+Revises: e1a5d3c8b742
+Create Date: 2026-10-15 13:41:08.274519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9a1e7b205'
+down_revision: Union[str, Sequence[str], None] = 'e1a5d3c8b742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Summary statistics are kept with the dataset so metadata endpoints skip re-parsing
+    # the file; existing rows start empty and are filled on first read
+    op.add_column('datasets', sa.Column('summary_stats_json', sa.JSON(), nullable=True))
+    op.add_column('datasets', sa.Column('summary_stats_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('datasets', 'summary_stats_version')
+    op.drop_column('datasets', 'summary_stats_json')
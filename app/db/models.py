@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase, relationship
-from sqlalchemy import String, Integer, DateTime, Text, Float, JSON, ForeignKey
+from sqlalchemy import String, Integer, DateTime, Text, Float, JSON, ForeignKey, Index
 from sqlalchemy.sql import func
 import uuid
 from datetime import datetime
@@ -17,6 +17,7 @@ class User(Base):
     role: Mapped[str] = mapped_column(String, default="user")  # user or admin
     status: Mapped[str] = mapped_column(String, default="active")  # active or inactive
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     projects: Mapped[list["Project"]] = relationship("Project", back_populates="user")
@@ -50,6 +51,9 @@ class Dataset(Base):
     rows: Mapped[int | None] = mapped_column(Integer)
     cols: Mapped[int | None] = mapped_column(Integer)
     columns_json: Mapped[dict | None] = mapped_column(JSON)
+    # Summary statistics of the file at storage_key; the version changes with every rewrite
+    summary_stats_json: Mapped[dict | None] = mapped_column(JSON)
+    summary_stats_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     uploaded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     validation_status: Mapped[str | None] = mapped_column(String, default="pending")  # pending, valid, issues_found
     last_validated: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -62,6 +66,10 @@ class Dataset(Base):
 
 class DatasetVersion(Base):
     __tablename__ = "dataset_versions"
+    # One row per (dataset, version); also serves version listings ordered by number
+    __table_args__ = (
+        Index("ix_dataset_versions_dataset_id_version_number", "dataset_id", "version_number", unique=True),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     dataset_id: Mapped[str] = mapped_column(String, ForeignKey("datasets.id"), nullable=False)
@@ -82,7 +90,7 @@ class ProjectDataset(Base):
     __tablename__ = "project_datasets"
 
     project_id: Mapped[str] = mapped_column(String, ForeignKey("projects.id"), primary_key=True)
-    dataset_id: Mapped[str] = mapped_column(String, ForeignKey("datasets.id"), primary_key=True)
+    dataset_id: Mapped[str] = mapped_column(String, ForeignKey("datasets.id"), primary_key=True, index=True)
 
     # Relationships
     project: Mapped["Project"] = relationship("Project", back_populates="project_datasets")
@@ -106,7 +114,7 @@ class Run(Base):
     dataset: Mapped["Dataset"] = relationship("Dataset", back_populates="runs")
     artifacts: Mapped[list["Artifact"]] = relationship("Artifact", back_populates="run")
     model_metas: Mapped[list["ModelMeta"]] = relationship("ModelMeta", back_populates="run")
-    logs: Mapped[list["Log"]] = relationship("Log", back_populates="run")
+    logs: Mapped[list["Log"]] = relationship("Log", back_populates="run", order_by="Log.timestamp")
 
 class Artifact(Base):
     __tablename__ = "artifacts"
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timedelta
+import threading
+import time
+import psutil
 from app.db.session import get_db
 from app.db.models import User, Log, Project, Run
 from app.schemas.auth import User as UserSchema, AdminUser, UserUpdate
 from app.dependencies.auth import get_current_user
-from sqlalchemy import func
+from app.utils.etag import check_etag
+from sqlalchemy import func, update
 
 router = APIRouter()
 
@@ -16,38 +20,44 @@ def admin_required(current_user: UserSchema = Depends(get_current_user)):
     return current_user
 
 @router.get("/users", response_model=List[AdminUser])
-def list_users(db: Session = Depends(get_db), current_user = Depends(admin_required)):
+def list_users(request: Request, response: Response, db: Session = Depends(get_db), current_user = Depends(admin_required)):
     """List all users — admin only."""
-    users = db.query(User).all()
-    if not users:
-        return []
-    user_projects = (
-        db.query(User.id, func.count(Project.id).label("project_count"))
+    user_fp = db.query(func.count(User.id), func.max(User.created_at), func.max(User.updated_at)).one()
+    project_fp = db.query(func.count(Project.id), func.max(Project.created_at)).one()
+    not_modified = check_etag(request, response, *user_fp, *project_fp)
+    if not_modified:
+        return not_modified
+
+    rows = (
+        db.query(User, func.count(Project.id).label("project_count"))
         .outerjoin(Project, User.id == Project.user_id)
         .group_by(User.id)
         .all()
     )
-    project_dict = {up.id: up.project_count for up in user_projects}
     return [
         AdminUser(
             id=user.id, name=user.name, email=user.email,
             role=user.role, status=user.status,
-            projects=project_dict.get(user.id, 0)
+            projects=project_count
         )
-        for user in users
+        for user, project_count in rows
     ]
 
 @router.put("/users/{user_id}", response_model=UserSchema)
 def update_user(user_id: str, user_update: UserUpdate, db: Session = Depends(get_db), current_user = Depends(admin_required)):
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    update_data = user_update.model_dump(exclude_unset=True)
+    columns = (User.id, User.name, User.email, User.role, User.status)
+    if update_data:
+        # Single UPDATE ... RETURNING with only the changed columns; no ORM load or attribute history
+        row = db.execute(
+            update(User).where(User.id == user_id).values(**update_data).returning(*columns)
+        ).first()
+        db.commit()
+    else:
+        row = db.query(*columns).filter(User.id == user_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
-    update_data = user_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(user, field, value)
-    db.commit()
-    db.refresh(user)
-    return UserSchema(id=user.id, name=user.name, email=user.email, role=user.role, status=user.status)
+    return UserSchema(**row._mapping)
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_user(user_id: str, db: Session = Depends(get_db), current_user = Depends(admin_required)):
@@ -59,16 +69,27 @@ def delete_user(user_id: str, db: Session = Depends(get_db), current_user = Depe
     return None
 
 @router.get("/logs")
-def get_logs(db: Session = Depends(get_db), current_user = Depends(admin_required)):
-    logs = db.query(Log).order_by(Log.timestamp.desc()).limit(100).all()
+def get_logs(request: Request, response: Response, db: Session = Depends(get_db), current_user = Depends(admin_required)):
+    log_fp = db.query(func.count(Log.id), func.max(Log.timestamp)).one()
+    not_modified = check_etag(request, response, *log_fp)
+    if not_modified:
+        return not_modified
+
+    # Plain column tuples: no ORM identity map or instance state for a read-only listing
+    rows = (
+        db.query(Log.run_id, Log.level, Log.message, Log.timestamp)
+        .order_by(Log.timestamp.desc())
+        .limit(100)
+        .all()
+    )
     return [
         {
-            "run_id": log.run_id,
-            "level": log.level,
-            "message": log.message,
-            "timestamp": str(log.timestamp) if log.timestamp else None
+            "run_id": run_id,
+            "level": level,
+            "message": message,
+            "timestamp": timestamp.isoformat() if timestamp else None
         }
-        for log in logs
+        for run_id, level, message, timestamp in rows
     ]
 
 @router.get("/templates")
@@ -81,15 +102,29 @@ def get_templates(db: Session = Depends(get_db), current_user = Depends(admin_re
         for t in templates
     ]
 
+# Admin dashboards poll /stats every few seconds; the aggregate counts scan whole
+# tables, so the computed payload is reused for a short window.
+STATS_TTL_SECONDS = 30.0
+_stats_lock = threading.Lock()
+_stats_cache = {"ts": 0.0, "value": None}
+
 @router.get("/stats")
 def get_stats(db: Session = Depends(get_db), current_user = Depends(admin_required)):
     """Real platform stats computed from the database."""
+    with _stats_lock:
+        now_ts = time.monotonic()
+        if _stats_cache["value"] is None or now_ts - _stats_cache["ts"] >= STATS_TTL_SECONDS:
+            _stats_cache["value"] = _compute_stats(db)
+            _stats_cache["ts"] = now_ts
+        return dict(_stats_cache["value"])
+
+def _compute_stats(db: Session) -> dict:
     now = datetime.utcnow()
     week_ago = now - timedelta(days=7)
     two_weeks_ago = now - timedelta(days=14)
 
-    user_count = db.query(User).count()
-    active_projects = db.query(Project).count()
+    user_count = db.query(func.count(User.id)).scalar() or 0
+    active_projects = db.query(func.count(Project.id)).scalar() or 0
 
     # Projects created this week
     projects_this_week = db.query(Project).filter(Project.created_at >= week_ago).count()
@@ -127,24 +162,51 @@ def get_stats(db: Session = Depends(get_db), current_user = Depends(admin_requir
         "platform_growth": growth
     }
 
+# System health sampling: psutil calls are syscall-heavy, so dashboard polling
+# is served from a short-lived cached sample instead of hitting the OS each time.
+SYSTEM_HEALTH_TTL_SECONDS = 2.0
+_health_lock = threading.Lock()
+_health_sample = {"ts": 0.0, "cpu_usage": 0.0, "memory_usage": 0.0, "storage_usage": 0.0}
+_disk_mountpoint: Optional[str] = None
+
+# Prime cpu_percent so later non-blocking calls measure usage since the previous call
+psutil.cpu_percent(interval=None)
+
+def _get_disk_mountpoint() -> Optional[str]:
+    """Resolve the mountpoint to report on once per process; drives rarely change."""
+    global _disk_mountpoint
+    if _disk_mountpoint is None:
+        # Platform-agnostic disk: use root "/" on Linux/Mac, fall back to first partition
+        try:
+            psutil.disk_usage("/")
+            _disk_mountpoint = "/"
+        except Exception:
+            try:
+                partitions = psutil.disk_partitions()
+                _disk_mountpoint = partitions[0].mountpoint if partitions else None
+            except Exception:
+                _disk_mountpoint = None
+    return _disk_mountpoint
+
 @router.get("/system-health")
 def get_system_health(current_user = Depends(admin_required)):
     """Live system resource metrics via psutil (platform-agnostic)."""
-    import psutil
-    cpu_percent = psutil.cpu_percent(interval=1)
-    memory = psutil.virtual_memory()
-    # Platform-agnostic disk: use root "/" on Linux/Mac, fall back to first partition
-    try:
-        disk = psutil.disk_usage("/")
-        disk_percent = disk.percent
-    except Exception:
-        try:
-            partitions = psutil.disk_partitions()
-            disk_percent = psutil.disk_usage(partitions[0].mountpoint).percent if partitions else 0
-        except Exception:
-            disk_percent = 0
-    return {
-        "cpu_usage": cpu_percent,
-        "memory_usage": memory.percent,
-        "storage_usage": disk_percent
-    }
+    with _health_lock:
+        now = time.monotonic()
+        if now - _health_sample["ts"] >= SYSTEM_HEALTH_TTL_SECONDS:
+            mountpoint = _get_disk_mountpoint()
+            try:
+                disk_percent = psutil.disk_usage(mountpoint).percent if mountpoint else 0
+            except Exception:
+                disk_percent = 0
+            _health_sample.update({
+                "ts": now,
+                "cpu_usage": psutil.cpu_percent(interval=None),
+                "memory_usage": psutil.virtual_memory().percent,
+                "storage_usage": disk_percent
+            })
+        return {
+            "cpu_usage": _health_sample["cpu_usage"],
+            "memory_usage": _health_sample["memory_usage"],
+            "storage_usage": _health_sample["storage_usage"]
+        }
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
-import pandas as pd
 import io
 import uuid
 import json
@@ -11,6 +10,7 @@ from app.dependencies.auth import get_current_user
 from app.config import settings
 from app.workers.tasks import run_eda
 from app.storage import storage
+from app.utils.tabular import read_frame
 from app.services.ml_service import MLService
 import asyncio
 from typing import Dict, List, Any, Optional
@@ -54,7 +54,7 @@ def run_eda_sync(run_id: str):
             raise Exception("Dataset not found")
 
         data_bytes = storage.get_object(dataset.storage_key)
-        df = pd.read_csv(io.BytesIO(data_bytes.read()))
+        df = read_frame(dataset.storage_key, io.BytesIO(data_bytes.read()))
 
         run.progress = 0.4
         run.current_task = "Analyzing data structure"
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile, File, Form
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.db.session import get_db
@@ -8,6 +9,11 @@ from app.dependencies.auth import get_current_user
 from app.services.dataset_service import DatasetService
 from app.services.data_validation_service import DataValidationService
 from app.services.data_science_service import DataScienceService
+from app.utils.etag import check_etag
+from app.workers.celery_app import celery_app
+from app.workers.tasks import clean_dataset_task
+from celery.result import AsyncResult
+import uuid
 
 from app.config import settings
 
@@ -73,7 +79,12 @@ def get_dataset_preview(
 ):
     try:
         preview = DatasetService.get_dataset_preview(dataset_id, current_user.id, db)
-        return DatasetPreview(**preview)
+        # The rows are already plain JSON values; orjson encodes them directly instead of
+        # re-validating every cell against DatasetPreview and running jsonable_encoder
+        return ORJSONResponse({
+            "columns": [str(col) for col in preview["columns"]],
+            "first_rows": preview["first_rows"]
+        })
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -89,18 +100,51 @@ def get_dataset(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.post("/{dataset_id}/clean")
+@router.post("/{dataset_id}/clean", status_code=202)
 def clean_dataset(
     dataset_id: str,
     options: dict = {},  # Optional cleaning options
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
+    # Ownership is checked here; parsing, cleaning and re-uploading run on a Celery worker
     try:
-        return DatasetService.clean_dataset(dataset_id, options, current_user.id, db)
+        DatasetService.get_dataset(dataset_id, current_user.id, db)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    task_id = str(uuid.uuid4())
+    clean_dataset_task.apply_async(
+        kwargs={"dataset_id": dataset_id, "options": options, "user_id": current_user.id},
+        task_id=task_id
+    )
+    return {"task_id": task_id, "dataset_id": dataset_id, "status": "PENDING"}
+
+@router.get("/{dataset_id}/clean/{task_id}")
+def get_clean_status(
+    dataset_id: str,
+    task_id: str,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    try:
+        DatasetService.get_dataset(dataset_id, current_user.id, db)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    res = AsyncResult(task_id, app=celery_app)
+    # Only report on this dataset's own cleaning tasks. Every stored state carries the task's
+    # kwargs (result_extended); PENDING means nothing is stored yet, so there is nothing to leak.
+    if res.state != "PENDING" and (res.kwargs or {}).get("dataset_id") != dataset_id:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    status = {"task_id": task_id, "dataset_id": dataset_id, "status": res.state, "result": None, "error": None}
+    if res.state == "SUCCESS":
+        status["result"] = res.result
+    elif res.state == "FAILURE":
+        status["error"] = str(res.info) if res.info else "Unknown error"
+    return status
+
 @router.post("/{dataset_id}/transform")
 def transform_dataset(
     dataset_id: str,
@@ -154,11 +198,12 @@ def list_datasets(
 @router.post("/{dataset_id}/validate")
 def validate_dataset(
     dataset_id: str,
+    refresh: bool = False,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     try:
-        return DataValidationService.validate_dataset(dataset_id, current_user.id, db)
+        return DataValidationService.validate_dataset(dataset_id, current_user.id, db, bypass_cache=refresh)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -176,10 +221,17 @@ def analyze_dataset_types(
 @router.get("/{dataset_id}/summary")
 def get_dataset_summary(
     dataset_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     try:
+        # The summary only changes along with the stored file, which bumps its version
+        dataset = DatasetService.get_dataset(dataset_id, current_user.id, db)
+        not_modified = check_etag(request, response, dataset.id, dataset.storage_key, dataset.summary_stats_version)
+        if not_modified:
+            return not_modified
         return DatasetService.get_dataset_summary(dataset_id, current_user.id, db)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
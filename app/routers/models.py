@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Response
+from sqlalchemy import Text, cast, func, text
+from sqlalchemy.orm import Session, contains_eager, raiseload
 from typing import List, Optional
 from app.db.session import get_db
 from app.db.models import ModelMeta, Run, Project, Artifact, Dataset, ProjectDataset
@@ -16,9 +17,10 @@ from app.schemas.models import (
 from app.schemas.runs import RunStart
 from app.dependencies.auth import get_current_user
 from app.storage import storage
+from app.utils.tabular import read_frame
 from app.services.ml_service import MLService
-import joblib
-import io
+import asyncio
+import numpy as np
 import pandas as pd
 import uuid
 import json
@@ -28,6 +30,15 @@ from app.workers.celery_app import celery_app
 
 router = APIRouter()
 
+def get_owned_model(model_id: str, db: Session = Depends(get_db), current_user = Depends(get_current_user)) -> ModelMeta:
+    """Resolve a model the current user owns, with its run loaded, in a single query."""
+    model_meta = db.query(ModelMeta).join(Run).join(Project).options(
+        contains_eager(ModelMeta.run)
+    ).filter(ModelMeta.id == model_id, Project.user_id == current_user.id).first()
+    if not model_meta:
+        raise HTTPException(status_code=404, detail="Model not found")
+    return model_meta
+
 @router.get("/projects/{project_id}/models")
 def getProjectModels(project_id: str, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
     """
@@ -41,8 +52,31 @@ def getProjectModels(project_id: str, db: Session = Depends(get_db), current_use
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    # On PostgreSQL, let the database build the JSON array in one row and pass it through as-is
+    if db.bind.dialect.name == "postgresql":
+        payload = db.query(
+            cast(
+                func.coalesce(
+                    func.json_agg(func.json_build_object(
+                        "id", ModelMeta.id,
+                        "run_id", ModelMeta.run_id,
+                        "name", ModelMeta.name,
+                        "storage_key", ModelMeta.storage_key,
+                        "metrics", func.coalesce(ModelMeta.metrics_json, text("'{}'::json")),
+                        "version", func.coalesce(ModelMeta.version, "1.0"),
+                        "created_at", ModelMeta.created_at
+                    )),
+                    text("'[]'::json")
+                ),
+                Text
+            )
+        ).select_from(ModelMeta).join(Run).filter(Run.project_id == project_id).scalar()
+        return Response(content=payload, media_type="application/json")
+
     # Get models for the project
-    models = db.query(ModelMeta).join(Run).filter(
+    models = db.query(ModelMeta).join(Run).options(
+        contains_eager(ModelMeta.run), raiseload("*")
+    ).filter(
         Run.project_id == project_id
     ).all()
 
@@ -54,25 +88,18 @@ def getProjectModels(project_id: str, db: Session = Depends(get_db), current_use
             "storage_key": model.storage_key,
             "metrics": model.metrics_json or {},
             "version": model.version or "1.0",
-            "created_at": str(model.created_at)
+            # ISO-8601, as json_build_object renders timestamps on the PostgreSQL path
+            "created_at": model.created_at.isoformat() if model.created_at else None
         }
         for model in models
     ]
 
 @router.get("/", response_model=List[ModelMetaSchema])
 def list_models(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    models = db.query(ModelMeta).join(Run).join(Project).filter(Project.user_id == current_user.id).all()
-    return [
-        ModelMetaSchema(
-            id=str(model.id),
-            run_id=str(model.run_id),
-            name=model.name,
-            storage_key=model.storage_key,
-            metrics_json=model.metrics_json or {},
-            created_at=model.created_at,
-            version=model.version or "1.0"
-        ) for model in models
-    ]
+    models = db.query(ModelMeta).join(Run).join(Project).options(
+        contains_eager(ModelMeta.run).contains_eager(Run.project), raiseload("*")
+    ).filter(Project.user_id == current_user.id).all()
+    return models
 
 @router.get("/leaderboard")
 def get_model_leaderboard(
@@ -130,40 +157,40 @@ def train_model(
     return {"message": "Training started", "run_id": response["run_id"]}
 
 @router.get("/{model_id}/metrics")
-def get_model_metrics(model_id: str, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    model_meta = db.query(ModelMeta).join(Run).join(Project).filter(ModelMeta.id == model_id, Project.user_id == current_user.id).first()
-    if not model_meta:
-        raise HTTPException(status_code=404, detail="Model not found")
+def get_model_metrics(model_meta: ModelMeta = Depends(get_owned_model)):
     return model_meta.metrics_json
 
 @router.post("/{model_id}/predict", response_model=PredictResponse)
-def predict(model_id: str, request: PredictRequest, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    model_meta = db.query(ModelMeta).join(Run).join(Project).filter(ModelMeta.id == model_id, Project.user_id == current_user.id).first()
-    if not model_meta:
-        raise HTTPException(status_code=404, detail="Model not found")
-
+async def predict(request: PredictRequest, model_meta: ModelMeta = Depends(get_owned_model)):
     # Validate input data
     validation = MLService.validate_prediction_input(model_meta, request.data)
     if not validation["valid"]:
         raise HTTPException(status_code=422, detail=validation)
 
-    # Load model from storage
-    model_bytes = storage.get_object(model_meta.storage_key)
-    if hasattr(model_bytes, "read"):
-        model = joblib.load(model_bytes)
-    else:
-        model = joblib.load(io.BytesIO(model_bytes))  # type: ignore
-
-    # Prepare input data
-    input_df = pd.DataFrame(request.data)
-    
-    # Ensure correct column ordering
+    # Load model from storage (cached per storage key) off the event loop
+    model = await asyncio.to_thread(MLService.load_model, model_meta.storage_key)
+
+    # Prepare input data: models trained on plain arrays get a typed float matrix in
+    # feature order; fall back to a DataFrame for non-numeric rows or models fitted on frames
     feature_names = model_meta.metrics_json.get("feature_names", [])
-    if feature_names:
-        input_df = input_df[feature_names]
+    input_data = None
+    if feature_names and not hasattr(model, "feature_names_in_"):
+        try:
+            input_data = np.fromiter(
+                (row[name] for row in request.data for name in feature_names),
+                dtype=np.float64,
+                count=len(request.data) * len(feature_names)
+            ).reshape(len(request.data), len(feature_names))
+        except (KeyError, TypeError, ValueError):
+            input_data = None
+    if input_data is None:
+        input_data = pd.DataFrame(request.data)
+        # Ensure correct column ordering
+        if feature_names:
+            input_data = input_data[feature_names]
 
     # Predict
-    predictions = model.predict(input_df)  # type: ignore
+    predictions = await asyncio.to_thread(model.predict, input_data)  # type: ignore
 
     # Generate summary
     summary = MLService.generate_prediction_summary(predictions)
@@ -171,30 +198,20 @@ def predict(model_id: str, request: PredictRequest, db: Session = Depends(get_db
     return PredictResponse(predictions=predictions.tolist(), summary=summary)
 
 @router.post("/{model_id}/predict-file")
-def predict_from_file(
-    model_id: str,
+async def predict_from_file(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    model_meta: ModelMeta = Depends(get_owned_model)
 ):
-    model_meta = db.query(ModelMeta).join(Run).join(Project).filter(ModelMeta.id == model_id, Project.user_id == current_user.id).first()
-    if not model_meta:
-        raise HTTPException(status_code=404, detail="Model not found")
-
     # Validate file type
     if not file.filename or not file.filename.lower().endswith(('.csv', '.json')):
         raise HTTPException(status_code=400, detail="Only CSV and JSON files are supported")
 
-    # Read file content
-    content = file.file.read()
-
-    # Parse data based on file type
+    # Parse data directly from the uploaded file stream (no intermediate bytes copy)
     if file.filename.lower().endswith('.csv'):
-        df = pd.read_csv(io.BytesIO(content))
+        df = await asyncio.to_thread(pd.read_csv, file.file)
         data = df.to_dict('records')
     else:  # JSON
-        import json
-        data = json.loads(content)
+        data = await asyncio.to_thread(json.load, file.file)
         if not isinstance(data, list):
             data = [data]
 
@@ -204,18 +221,14 @@ def predict_from_file(
         raise HTTPException(status_code=422, detail=validation)
 
     # Load model and predict
-    model_bytes = storage.get_object(model_meta.storage_key)
-    if hasattr(model_bytes, "read"):
-        model = joblib.load(model_bytes)
-    else:
-        model = joblib.load(io.BytesIO(model_bytes))  # type: ignore
+    model = await asyncio.to_thread(MLService.load_model, model_meta.storage_key)
 
     input_df = pd.DataFrame(data)
     feature_names = model_meta.metrics_json.get("feature_names", [])
     if feature_names:
         input_df = input_df[feature_names]
 
-    predictions = model.predict(input_df)  # type: ignore
+    predictions = await asyncio.to_thread(model.predict, input_df)  # type: ignore
 
     # Generate summary
     summary = MLService.generate_prediction_summary(predictions)
@@ -224,30 +237,21 @@ def predict_from_file(
 
 @router.post("/{model_id}/predict-batch", response_model=BatchPredictResponse)
 def predict_batch(
-    model_id: str,
     file: UploadFile = File(...),
     batch_size: int = 1000,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    model_meta: ModelMeta = Depends(get_owned_model)
 ):
-    model_meta = db.query(ModelMeta).join(Run).join(Project).filter(ModelMeta.id == model_id, Project.user_id == current_user.id).first()
-    if not model_meta:
-        raise HTTPException(status_code=404, detail="Model not found")
-
     # Validate file type
     if not file.filename or not file.filename.lower().endswith(('.csv', '.json')):
         raise HTTPException(status_code=400, detail="Only CSV and JSON files are supported")
 
-    content = file.file.read()
-
     # Fast validation of file sample to prevent starting a failing background task
     try:
         if file.filename.lower().endswith('.csv'):
-            df_sample = pd.read_csv(io.BytesIO(content), nrows=5)
+            df_sample = pd.read_csv(file.file, nrows=5)
             sample_data = df_sample.to_dict('records')
         else:
-            import json
-            sample_data = json.loads(content)
+            sample_data = json.load(file.file)
             if isinstance(sample_data, list) and sample_data:
                 sample_data = sample_data[:5]
             else:
@@ -261,9 +265,10 @@ def predict_batch(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to validate file schema: {str(e)}")
 
-    # Upload file to storage
+    # Stream the spooled upload to storage instead of buffering it in memory
     file_key = f"predictions/input/{uuid.uuid4()}_{file.filename}"
-    storage.put_object(file_key, content)
+    file.file.seek(0)
+    storage.upload_fileobj(file_key, file.file)
 
     # Create task ID
     task_id = str(uuid.uuid4())
@@ -287,18 +292,9 @@ def predict_batch(
 
 @router.get("/{model_id}/predict-batch/{task_id}", response_model=BatchPredictStatus)
 def get_batch_predict_status(
-    model_id: str,
     task_id: str,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    model_meta: ModelMeta = Depends(get_owned_model)
 ):
-    # Check model ownership
-    model_meta = db.query(ModelMeta).join(Run).join(Project).filter(
-        ModelMeta.id == model_id, Project.user_id == current_user.id
-    ).first()
-    if not model_meta:
-        raise HTTPException(status_code=404, detail="Model not found")
-
     res = AsyncResult(task_id, app=celery_app)
     state = res.state
     progress = 0.0
@@ -327,21 +323,13 @@ def get_batch_predict_status(
 
 @router.get("/{model_id}/explain", response_model=ExplainResponse)
 def get_model_explanation(
-    model_id: str,
     method: Optional[str] = "shap",
+    model_meta: ModelMeta = Depends(get_owned_model),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    model_meta = db.query(ModelMeta).join(Run).join(Project).filter(
-        ModelMeta.id == model_id, Project.user_id == current_user.id
-    ).first()
-    if not model_meta:
-        raise HTTPException(status_code=404, detail="Model not found")
-
-    # Get project and dataset info for context
-    run = db.query(Run).filter(Run.id == model_meta.run_id).first()
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
+    # Project context comes from the run loaded alongside the model
+    run = model_meta.run
 
     # Get datasets for the project
     datasets = db.query(Dataset).join(ProjectDataset).join(Project).filter(
@@ -354,7 +342,7 @@ def get_model_explanation(
     # Load first 5 rows of the principal dataset as sample data
     try:
         file_obj = storage.download_stream(datasets[0].storage_key)
-        df = pd.read_csv(file_obj)
+        df = read_frame(datasets[0].storage_key, file_obj)
         if 'target' in df.columns:
             df = df.drop(columns=['target'])
         # Drop internal columns if they exist
@@ -380,19 +368,13 @@ def get_model_explanation(
 
 @router.post("/{model_id}/explain", response_model=ExplainResponse)
 def explain_prediction(
-    model_id: str,
     request: ExplainRequest,
+    model_meta: ModelMeta = Depends(get_owned_model),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    model_meta = db.query(ModelMeta).join(Run).join(Project).filter(ModelMeta.id == model_id, Project.user_id == current_user.id).first()
-    if not model_meta:
-        raise HTTPException(status_code=404, detail="Model not found")
-
-    # Get project and dataset info for context
-    run = db.query(Run).filter(Run.id == model_meta.run_id).first()
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
+    # Project context comes from the run loaded alongside the model
+    run = model_meta.run
 
     # Get datasets for the project
     datasets = db.query(Dataset).join(ProjectDataset).join(Project).filter(
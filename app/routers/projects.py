@@ -24,7 +24,7 @@ def create_project(project_create: ProjectCreate, db: Session = Depends(get_db),
     db.add(project)
     db.commit()
     db.refresh(project)
-    return ProjectSchema.from_orm(project)
+    return project
 
 @router.get("/", response_model=List[ProjectSchema])
 def list_projects(
@@ -39,7 +39,8 @@ def list_projects(
         limit = 20
     offset = (page - 1) * limit
     projects = db.query(ProjectModel).filter(ProjectModel.user_id == current_user.id).offset(offset).limit(limit).all()
-    return [ProjectSchema.from_orm(p) for p in projects]
+    # Validated once, by the response model, straight from the ORM attributes
+    return projects
 
 @router.get("/overview-stats")
 def get_portfolio_stats(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
@@ -134,7 +135,7 @@ def get_project(project_id: str, db: Session = Depends(get_db), current_user = D
     project = db.query(ProjectModel).filter(ProjectModel.id == project_id, ProjectModel.user_id == current_user.id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return ProjectSchema.from_orm(project)
+    return project
 
 @router.put("/{project_id}", response_model=ProjectSchema)
 def update_project(project_id: str, project_update: ProjectCreate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
@@ -145,7 +146,7 @@ def update_project(project_id: str, project_update: ProjectCreate, db: Session =
     project.description = project_update.description
     db.commit()
     db.refresh(project)
-    return ProjectSchema.from_orm(project)
+    return project
 
 @router.delete("/{project_id}")
 def delete_project(project_id: str, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
@@ -190,6 +191,7 @@ def get_project_datasets(project_id: str, db: Session = Depends(get_db), current
 def generate_eda_report(
     project_id: str,
     dataset_ids: Optional[List[str]] = None,
+    refresh: bool = False,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
@@ -201,7 +203,8 @@ def generate_eda_report(
             project_id=project_id,
             user_id=current_user.id,
             db=db,
-            dataset_ids=dataset_ids
+            dataset_ids=dataset_ids,
+            bypass_cache=refresh
         )
         return result
     except ValueError as e:
@@ -1,49 +1,48 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.orm import Session, contains_eager, raiseload, selectinload
+from typing import List, Optional
 from app.db.session import get_db
-from app.db.models import Run, Project, Dataset, Log, Artifact
+from app.db.models import Run, Project, Dataset, Artifact
 from app.schemas.runs import RunStart, RunStatus, Artifact as ArtifactSchema, Run as RunSchema
 from app.dependencies.auth import get_current_user
 from app.workers.celery_app import celery_app
 from app.workers.tasks import preprocess_data, run_eda, train_models, finalize_run
+from app.storage import storage
+from concurrent.futures import ThreadPoolExecutor
 import uuid
 
 router = APIRouter()
 
+PRESIGN_MAX_WORKERS = 8
+
+# Analysis pipeline canvas, declared once. Each task returns the run id, which the
+# chain feeds to the next step, so only the first step takes arguments at enqueue time.
+RUN_PIPELINE = (
+    preprocess_data.s() |
+    run_eda.s() |
+    train_models.s() |
+    finalize_run.s()
+)
+
+def _safe_presigned_url(storage_key: str) -> Optional[str]:
+    try:
+        return storage.get_presigned_url(storage_key)
+    except Exception:
+        return None
+
 @router.get("/", response_model=List[RunSchema])
 def list_runs(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    runs = db.query(Run).join(Project).filter(Project.user_id == current_user.id).all()
-    return [
-        RunSchema(
-            id=run.id,
-            project_id=run.project_id,
-            dataset_id=run.dataset_id,
-            status=run.status,
-            current_task=run.current_task,
-            started_at=run.started_at,
-            finished_at=run.finished_at,
-            progress=run.progress,
-            parameters_json=run.parameters_json
-        ) for run in runs
-    ]
+    runs = db.query(Run).join(Project).options(
+        contains_eager(Run.project), raiseload("*")
+    ).filter(Project.user_id == current_user.id).all()
+    return runs
 
 @router.get("/{run_id}", response_model=RunSchema)
 def get_run(run_id: str, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
     run = db.query(Run).join(Project).filter(Run.id == run_id, Project.user_id == current_user.id).first()
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
-    return RunSchema(
-        id=run.id,
-        project_id=run.project_id,
-        dataset_id=run.dataset_id,
-        status=run.status,
-        current_task=run.current_task,
-        started_at=run.started_at,
-        finished_at=run.finished_at,
-        progress=run.progress,
-        parameters_json=run.parameters_json
-    )
+    return run
 
 @router.post("/start")
 def start_run(run_start: RunStart, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
@@ -70,25 +69,22 @@ def start_run(run_start: RunStart, db: Session = Depends(get_db), current_user =
     db.commit()
     db.refresh(run)
 
-    # Enqueue Celery chain
-    chain = (
-        preprocess_data.s(run.id, dataset.storage_key) |
-        run_eda.s(run.id) |
-        train_models.s(run.id) |
-        finalize_run.s(run.id)
-    )
-    chain.apply_async()
+    # Enqueue Celery chain (steps are cloned per call, so the shared template is never mutated)
+    RUN_PIPELINE.apply_async(args=(run.id, dataset.storage_key))
 
     return {"run_id": run.id, "status": run.status}
 
 @router.get("/{run_id}/status", response_model=RunStatus)
 def get_run_status(run_id: str, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    run = db.query(Run).join(Project).filter(Run.id == run_id, Project.user_id == current_user.id).first()
+    # Logs come in with the run (ordered by timestamp via the relationship); the same
+    # selectin load batches into one IN query if several runs are fetched at once
+    run = db.query(Run).join(Project).options(selectinload(Run.logs)).filter(
+        Run.id == run_id, Project.user_id == current_user.id
+    ).first()
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    logs = db.query(Log).filter(Log.run_id == run_id).order_by(Log.timestamp).all()
-    logs_list = [{"level": log.level, "message": log.message, "timestamp": log.timestamp.isoformat()} for log in logs]
+    logs_list = [{"level": log.level, "message": log.message, "timestamp": log.timestamp.isoformat()} for log in run.logs]
 
     return RunStatus(
         run_id=run.id,
@@ -104,23 +100,17 @@ def get_run_artifacts(run_id: str, db: Session = Depends(get_db), current_user =
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    artifacts = db.query(Artifact).filter(Artifact.run_id == run_id).all()
+    artifacts = db.query(Artifact).options(raiseload("*")).filter(Artifact.run_id == run_id).all()
+    if not artifacts:
+        return []
+
+    # Sign all download URLs concurrently instead of one after another
+    with ThreadPoolExecutor(max_workers=min(PRESIGN_MAX_WORKERS, len(artifacts))) as executor:
+        download_urls = list(executor.map(_safe_presigned_url, [a.storage_key for a in artifacts]))
+
     result = []
-    for artifact in artifacts:
-        download_url = None
-        try:
-            from app.storage import storage
-            download_url = storage.get_presigned_url(artifact.storage_key)
-        except Exception:
-            download_url = None
-        result.append(ArtifactSchema(
-            id=str(artifact.id),
-            run_id=str(artifact.run_id),
-            type=artifact.type,
-            storage_key=artifact.storage_key,
-            filename=artifact.filename,
-            metadata_json=artifact.metadata_json,
-            created_at=artifact.created_at,
-            download_url=download_url
-        ))
+    for artifact, download_url in zip(artifacts, download_urls):
+        artifact_schema = ArtifactSchema.model_validate(artifact)
+        artifact_schema.download_url = download_url
+        result.append(artifact_schema)
     return result
@@ -7,19 +7,25 @@ import httpx
 
 router = APIRouter()
 
+# For now, return mock data. In production, integrate with real stock API
+MOCK_STOCKS = [
+    {"symbol": "AAPL", "name": "Apple Inc.", "price": 150.0},
+    {"symbol": "GOOGL", "name": "Alphabet Inc.", "price": 2800.0},
+    {"symbol": "MSFT", "name": "Microsoft Corporation", "price": 300.0},
+]
+
+# Lowercased search keys built once at import rather than per request and per item
+_STOCK_SEARCH_INDEX = [
+    (stock["symbol"].lower(), stock["name"].lower(), stock) for stock in MOCK_STOCKS
+]
+
 @router.get("/search")
 async def search_stocks(query: str, current_user: User = Depends(get_current_user)):
     """
     Search for stocks using external API (e.g., Alpha Vantage or similar)
     """
-    # For now, return mock data. In production, integrate with real stock API
-    mock_stocks = [
-        {"symbol": "AAPL", "name": "Apple Inc.", "price": 150.0},
-        {"symbol": "GOOGL", "name": "Alphabet Inc.", "price": 2800.0},
-        {"symbol": "MSFT", "name": "Microsoft Corporation", "price": 300.0},
-    ]
-
     # Filter by query
-    results = [stock for stock in mock_stocks if query.lower() in stock["symbol"].lower() or query.lower() in stock["name"].lower()]
+    q = query.lower()
+    results = [stock for symbol_l, name_l, stock in _STOCK_SEARCH_INDEX if q in symbol_l or q in name_l]
 
     return {"stocks": results}
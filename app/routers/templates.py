@@ -11,14 +11,15 @@ router = APIRouter()
 @router.get("/", response_model=List[TemplateSchema])
 def list_templates(db: Session = Depends(get_db)):
     templates = db.query(Template).filter(Template.is_public == 1).all()
-    return [TemplateSchema.from_orm(t) for t in templates]
+    # Validated once, by the response model, straight from the ORM attributes
+    return templates
 
 @router.get("/{template_id}", response_model=TemplateSchema)
 def get_template(template_id: str, db: Session = Depends(get_db)):
     template = db.query(Template).filter(Template.id == template_id, Template.is_public == 1).first()
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
-    return TemplateSchema.from_orm(template)
+    return template
 
 @router.post("/{template_id}/apply")
 def apply_template(
@@ -56,4 +57,4 @@ def create_template(template_create: TemplateCreate, db: Session = Depends(get_d
     db.add(template)
     db.commit()
     db.refresh(template)
-    return TemplateSchema.from_orm(template)
+    return template
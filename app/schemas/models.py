@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -13,6 +13,16 @@ class ModelMeta(BaseModel):
     created_at: datetime
     version: Optional[str]
 
+    @field_validator("metrics_json", mode="before")
+    @classmethod
+    def _default_metrics(cls, value):
+        return value or {}
+
+    @field_validator("version", mode="before")
+    @classmethod
+    def _default_version(cls, value):
+        return value or "1.0"
+
 class PredictRequest(BaseModel):
     data: List[Dict[str, Any]]
 
@@ -7,7 +7,8 @@ class ProjectCreate(BaseModel):
     description: Optional[str] = None
 
 class Project(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    # Read-only response model: frozen instances skip assignment handling entirely
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: str
     user_id: str
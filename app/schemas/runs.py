@@ -37,4 +37,4 @@ class Artifact(BaseModel):
     filename: str
     metadata_json: Optional[Dict[str, Any]]
     created_at: datetime
-    download_url: Optional[str]
+    download_url: Optional[str] = None
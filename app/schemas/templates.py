@@ -12,7 +12,8 @@ class TemplateCreate(TemplateBase):
     pass
 
 class Template(TemplateBase):
-    model_config = ConfigDict(from_attributes=True)
+    # Read-only response model: frozen instances skip assignment handling entirely
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: str
     is_public: int
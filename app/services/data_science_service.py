@@ -1,12 +1,11 @@
 from sqlalchemy.orm import Session
 import pandas as pd
 import numpy as np
-import io
-import uuid
 from typing import Dict, List, Any
 from app.db.models import Dataset, DatasetVersion
 from app.storage import storage
 from app.services.dataset_service import DatasetService
+from app.services.eda_service import EDAService
 from scipy.stats import ks_2samp, wasserstein_distance
 
 class DataScienceService:
@@ -25,7 +24,7 @@ class DataScienceService:
 
         # Load dataset
         file_obj = storage.download_stream(dataset.storage_key)
-        df = DatasetService._read_dataframe_from_file(file_obj, dataset.filename)
+        df = DatasetService._read_dataframe_from_file(file_obj, dataset.storage_key)
 
         total_rows = int(len(df))
         total_cols = int(len(df.columns))
@@ -179,7 +178,7 @@ class DataScienceService:
 
         # Load dataset
         file_obj = storage.download_stream(dataset.storage_key)
-        df = DatasetService._read_dataframe_from_file(file_obj, dataset.filename)
+        df = DatasetService._read_dataframe_from_file(file_obj, dataset.storage_key)
 
         suggestions = []
         for col in df.columns:
@@ -278,7 +277,7 @@ class DataScienceService:
 
         # Load dataset
         file_obj = storage.download_stream(dataset.storage_key)
-        df = DatasetService._read_dataframe_from_file(file_obj, dataset.filename)
+        df = DatasetService._read_dataframe_from_file(file_obj, dataset.storage_key)
 
         rows_before = int(df.shape[0])
         cols_before = int(df.shape[1])
@@ -319,15 +318,10 @@ class DataScienceService:
                     applied.append(f"Scaled '{col}'")
 
         # Save new dataframe to storage
-        new_key = f"features/{uuid.uuid4()}_{dataset.filename}"
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        storage.upload_fileobj(new_key, io.BytesIO(csv_buffer.getvalue().encode()))
+        new_key = DatasetService._store_dataframe(df, "features", dataset.filename)
 
         # Create new version record
-        next_version = int(db.query(DatasetVersion).filter(
-            DatasetVersion.dataset_id == dataset_id
-        ).count() + 1)
+        next_version = DatasetService._next_version_number(dataset_id, db)
 
         changes_summary = "Applied feature engineering: " + ", ".join(applied)
 
@@ -348,8 +342,11 @@ class DataScienceService:
         dataset.storage_key = new_key
         dataset.rows = int(df.shape[0])
         dataset.cols = int(df.shape[1])
-        dataset.columns_json = DatasetService._analyze_column_types(df)
+        column_counts = DatasetService._column_counts(df)
+        dataset.columns_json = DatasetService._analyze_column_types(df, column_counts)
+        DatasetService._set_summary_stats(dataset, DatasetService._generate_summary_stats(df, new_key, column_counts))
         db.commit()
+        EDAService.invalidate_combined_cache(dataset_id)
 
         return {
             "message": "Feature engineering applied successfully",
@@ -375,14 +372,14 @@ class DataScienceService:
         if not baseline:
             raise ValueError("Baseline dataset not found")
         file_obj1 = storage.download_stream(baseline.storage_key)
-        df_base = DatasetService._read_dataframe_from_file(file_obj1, baseline.filename)
+        df_base = DatasetService._read_dataframe_from_file(file_obj1, baseline.storage_key)
 
         # Load target dataset
         target = db.query(Dataset).filter(Dataset.id == target_id, Dataset.user_id == user_id).first()
         if not target:
             raise ValueError("Target dataset not found")
         file_obj2 = storage.download_stream(target.storage_key)
-        df_target = DatasetService._read_dataframe_from_file(file_obj2, target.filename)
+        df_target = DatasetService._read_dataframe_from_file(file_obj2, target.storage_key)
 
         common_cols = list(set(df_base.columns) & set(df_target.columns))
         if not common_cols:
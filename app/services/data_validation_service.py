@@ -1,16 +1,49 @@
 from sqlalchemy.orm import Session
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
+from dataclasses import dataclass
+from typing import Dict, List, Any, Set
 from app.db.models import Dataset
 from app.storage import storage
+from app.utils.cache import get_cached_json, set_cached_json
+from app.utils.tabular import iter_csv_arrow, iter_parquet
+import pyarrow as pa
+
+# Rows parsed per chunk by the pandas fallback reader (Arrow chunks by block size). Peak memory
+# is bounded by one chunk plus the numeric columns retained for the quantile-based outlier check.
+VALIDATION_CHUNK_ROWS = 100_000
+
+# Text columns are judged "numeric stored as text" from a sample of their non-null values
+NUMERIC_PROBE_ROWS = 1000
+NUMERIC_PROBE_RATIO = 0.95
+
+# Numeric columns with fewer distinct values than this look categorical. Cardinality is
+# counted on a prefix first; only columns still under the threshold there get a full count.
+LOW_CARDINALITY_THRESHOLD = 10
+CARDINALITY_PROBE_ROWS = 10_000
+
+@dataclass
+class _ValidationContext:
+    """Everything the checks need, gathered in one pass over the file by _scan_chunks"""
+    columns: List[str]
+    total_rows: int
+    missing_by_column: pd.Series
+    row_hashes: np.ndarray
+    object_columns: Set[str]
+    object_samples: Dict[str, pd.Series]
+    numeric_columns: List[str]
+    numeric_dtypes: Dict[str, str]
+    # Exact below LOW_CARDINALITY_THRESHOLD, lower bounds at or above it
+    numeric_unique: Dict[str, int]
+    numeric_missing: np.ndarray
+    numeric_values: np.ndarray
 
 class DataValidationService:
     @staticmethod
-    def validate_dataset(dataset_id: str, user_id: str, db: Session) -> Dict[str, Any]:
+    def validate_dataset(dataset_id: str, user_id: str, db: Session, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Perform comprehensive data validation on a dataset
-        Returns validation results with issues found
+        Returns validation results with issues found (cached per stored file)
         """
         # Get dataset
         dataset = db.query(Dataset).filter(
@@ -20,14 +53,31 @@ class DataValidationService:
         if not dataset:
             raise ValueError("Dataset not found")
 
-        # Load dataset
-        file_obj = storage.download_stream(dataset.storage_key)
-        df = pd.read_csv(file_obj)
+        # Stored files are never rewritten in place, so the storage key identifies the content
+        cache_key = f"validation:{dataset.id}:{dataset.storage_key}"
+        cached = None if bypass_cache else get_cached_json(cache_key)
+        if cached is not None:
+            DataValidationService._record_validation(dataset, cached, db)
+            return cached
+
+        if dataset.storage_key.lower().endswith('.parquet'):
+            # Columnar file: batches decode straight from the typed pages, no text parsing
+            ctx = DataValidationService._scan_chunks(iter_parquet(storage.download_stream(dataset.storage_key)))
+        else:
+            # Stream the dataset in chunks, parsed by Arrow; restart on the pandas parser
+            # if the file does not fit Arrow's schema inference
+            try:
+                ctx = DataValidationService._scan_chunks(iter_csv_arrow(storage.download_stream(dataset.storage_key)))
+            except pa.ArrowInvalid:
+                ctx = DataValidationService._scan_chunks(
+                    pd.read_csv(storage.download_stream(dataset.storage_key), chunksize=VALIDATION_CHUNK_ROWS)
+                )
+        total_rows = ctx.total_rows
 
         validation_results = {
             "dataset_id": dataset_id,
-            "total_rows": len(df),
-            "total_columns": len(df.columns),
+            "total_rows": total_rows,
+            "total_columns": len(ctx.columns),
             "issues": [],
             "summary": {
                 "missing_values": 0,
@@ -39,25 +89,25 @@ class DataValidationService:
         }
 
         # Check for missing values
-        missing_info = DataValidationService._check_missing_values(df)
+        missing_info = DataValidationService._check_missing_values(ctx)
         if missing_info["total_missing"] > 0:
             validation_results["issues"].append(missing_info)
             validation_results["summary"]["missing_values"] = missing_info["total_missing"]
 
         # Check for duplicate rows
-        duplicate_info = DataValidationService._check_duplicates(df)
+        duplicate_info = DataValidationService._check_duplicates(ctx)
         if duplicate_info["duplicate_count"] > 0:
             validation_results["issues"].append(duplicate_info)
             validation_results["summary"]["duplicate_rows"] = duplicate_info["duplicate_count"]
 
         # Check data types and potential issues
-        dtype_info = DataValidationService._check_data_types(df)
+        dtype_info = DataValidationService._check_data_types(ctx)
         if dtype_info["issues"]:
             validation_results["issues"].extend(dtype_info["issues"])
             validation_results["summary"]["data_type_issues"] = len(dtype_info["issues"])
 
         # Check for outliers (basic statistical analysis)
-        outlier_info = DataValidationService._check_outliers(df)
+        outlier_info = DataValidationService._check_outliers(ctx)
         if outlier_info["outlier_count"] > 0:
             validation_results["issues"].append(outlier_info)
             validation_results["summary"]["outlier_count"] = outlier_info["outlier_count"]
@@ -65,29 +115,95 @@ class DataValidationService:
         # Determine overall severity
         validation_results["severity"] = DataValidationService._calculate_severity(validation_results)
 
-        # Update dataset validation status
+        set_cached_json(cache_key, validation_results)
+        DataValidationService._record_validation(dataset, validation_results, db)
+
+        return validation_results
+
+    @staticmethod
+    def _record_validation(dataset: Dataset, validation_results: Dict[str, Any], db: Session) -> None:
+        """Update dataset validation status"""
         from datetime import datetime
         dataset.validation_status = "valid" if validation_results["severity"] == "good" else "issues_found"
         dataset.last_validated = datetime.utcnow()
         db.commit()
 
-        return validation_results
+    @staticmethod
+    def _scan_chunks(chunks) -> _ValidationContext:
+        """
+        Single pass over the file's DataFrame chunks collecting everything the checks need: missing counts,
+        row hashes and column kinds. Only numeric columns are kept across chunks and end up as
+        one float64 block with their cardinalities; text columns keep a small probe sample.
+        The _check_* helpers are projections over the returned context.
+        """
+        columns: List[str] = []
+        total_rows = 0
+        missing_by_column = None
+        row_hashes = []
+        numeric_parts = []
+        object_columns = set()
+        object_samples: Dict[str, pd.Series] = {}
+
+        for chunk in chunks:
+            if not columns:
+                columns = list(chunk.columns)
+            total_rows += len(chunk)
+            chunk_missing = chunk.isnull().sum()
+            missing_by_column = chunk_missing if missing_by_column is None else missing_by_column.add(chunk_missing, fill_value=0)
+            row_hashes.append(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+            for col in chunk.select_dtypes(include=['object']).columns:
+                object_columns.add(col)
+                sample = object_samples.get(col)
+                if sample is None or len(sample) < NUMERIC_PROBE_ROWS:
+                    taken = chunk[col].dropna().head(NUMERIC_PROBE_ROWS - (0 if sample is None else len(sample)))
+                    object_samples[col] = taken if sample is None else pd.concat([sample, taken])
+            numeric_parts.append(chunk.select_dtypes(include=[np.number]))
+
+        numeric_df = pd.concat(numeric_parts, ignore_index=True) if numeric_parts else pd.DataFrame()
+        # A column parsed as numbers in one chunk but text in another is text overall
+        numeric_df = numeric_df.drop(columns=[c for c in numeric_df.columns if c in object_columns])
+
+        if missing_by_column is None:
+            missing_by_column = pd.Series(dtype='int64')
+
+        numeric_unique = numeric_df.iloc[:CARDINALITY_PROBE_ROWS].nunique()
+        if len(numeric_df) > CARDINALITY_PROBE_ROWS:
+            few = numeric_unique.index[numeric_unique < LOW_CARDINALITY_THRESHOLD]
+            if len(few) > 0:
+                numeric_unique[few] = numeric_df[few].nunique()
+
+        return _ValidationContext(
+            columns=columns,
+            total_rows=total_rows,
+            missing_by_column=missing_by_column,
+            row_hashes=np.concatenate(row_hashes) if row_hashes else np.empty(0, dtype=np.uint64),
+            object_columns=object_columns,
+            object_samples=object_samples,
+            numeric_columns=list(numeric_df.columns),
+            numeric_dtypes={col: str(dtype) for col, dtype in numeric_df.dtypes.items()},
+            numeric_unique=numeric_unique.to_dict(),
+            numeric_missing=missing_by_column.reindex(numeric_df.columns, fill_value=0).to_numpy(),
+            numeric_values=numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        )
 
     @staticmethod
-    def _check_missing_values(df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_missing_values(ctx: _ValidationContext) -> Dict[str, Any]:
         """Check for missing values in the dataset"""
-        missing_by_column = df.isnull().sum()
+        missing_by_column = ctx.missing_by_column
+        total_rows = ctx.total_rows
         total_missing = missing_by_column.sum()
 
-        missing_details = []
-        for col, count in missing_by_column.items():
-            if count > 0:
-                percentage = (count / len(df)) * 100
-                missing_details.append({
-                    "column": col,
-                    "missing_count": int(count),
-                    "missing_percentage": round(percentage, 2)
-                })
+        # Select the affected columns and their percentages in one shot; only those are walked
+        affected = missing_by_column[missing_by_column.to_numpy() > 0]
+        percentages = (affected.to_numpy() / total_rows * 100).round(2) if total_rows > 0 else np.zeros(len(affected))
+        missing_details = [
+            {
+                "column": col,
+                "missing_count": int(count),
+                "missing_percentage": float(percentage)
+            }
+            for col, count, percentage in zip(affected.index, affected.to_numpy(), percentages)
+        ]
 
         return {
             "type": "missing_values",
@@ -97,42 +213,42 @@ class DataValidationService:
         }
 
     @staticmethod
-    def _check_duplicates(df: pd.DataFrame) -> Dict[str, Any]:
-        """Check for duplicate rows"""
-        duplicate_count = df.duplicated().sum()
+    def _check_duplicates(ctx: _ValidationContext) -> Dict[str, Any]:
+        """Check for duplicate rows (across chunks) from their 64-bit row hashes"""
+        total_rows = ctx.total_rows
+        duplicate_count = total_rows - len(np.unique(ctx.row_hashes))
 
         return {
             "type": "duplicate_rows",
             "severity": "warning" if duplicate_count > 0 else "good",
             "duplicate_count": int(duplicate_count),
-            "duplicate_percentage": round((duplicate_count / len(df)) * 100, 2) if len(df) > 0 else 0
+            "duplicate_percentage": round((duplicate_count / total_rows) * 100, 2) if total_rows > 0 else 0
         }
 
     @staticmethod
-    def _check_data_types(df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_data_types(ctx: _ValidationContext) -> Dict[str, Any]:
         """Check for potential data type issues"""
         issues = []
+        numeric_dtypes = ctx.numeric_dtypes
 
-        for col in df.columns:
-            dtype = df[col].dtype
-            unique_count = df[col].nunique()
-
+        for col in ctx.columns:
             # Check for numeric columns that might be strings
-            if dtype == 'object':
-                # Try to convert to numeric
-                try:
-                    pd.to_numeric(df[col], errors='coerce')
+            if col in ctx.object_columns:
+                sample = ctx.object_samples.get(col)
+                if sample is None or sample.empty:
+                    continue
+                coerced = pd.to_numeric(sample, errors='coerce')
+                if coerced.notna().mean() > NUMERIC_PROBE_RATIO:
                     issues.append({
                         "type": "potential_numeric",
                         "column": col,
                         "message": f"Column '{col}' appears to contain numeric data but is stored as text"
                     })
-                except:
-                    pass
 
             # Check for low cardinality in numeric columns (might be categorical)
-            elif dtype in ['int64', 'float64']:
-                if unique_count < 10 and len(df) > 50:
+            elif numeric_dtypes.get(col) in ['int64', 'float64']:
+                unique_count = ctx.numeric_unique[col]
+                if unique_count < LOW_CARDINALITY_THRESHOLD and ctx.total_rows > 50:
                     issues.append({
                         "type": "potential_categorical",
                         "column": col,
@@ -144,29 +260,31 @@ class DataValidationService:
         }
 
     @staticmethod
-    def _check_outliers(df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_outliers(ctx: _ValidationContext) -> Dict[str, Any]:
         """Basic outlier detection using IQR method"""
         outlier_count = 0
         outlier_details = []
 
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-
-        for col in numeric_cols:
-            if df[col].isnull().sum() < len(df) * 0.5:  # Skip if more than 50% missing
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
+        # Skip columns with more than 50% missing (counts come from the scan),
+        # then fence all remaining columns at once
+        eligible = ctx.numeric_missing < ctx.total_rows * 0.5
+        columns = [col for col, keep in zip(ctx.numeric_columns, eligible) if keep]
+        values = ctx.numeric_values[:, eligible]
 
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
+        if len(columns) > 0:
+            Q1, Q3 = np.nanpercentile(values, [25, 75], axis=0)
+            IQR = Q3 - Q1
+            lower_bounds = Q1 - 1.5 * IQR
+            upper_bounds = Q3 + 1.5 * IQR
+            counts = np.count_nonzero((values < lower_bounds) | (values > upper_bounds), axis=0)
 
-                outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-                if len(outliers) > 0:
-                    outlier_count += len(outliers)
+            for col, count, lower_bound, upper_bound in zip(columns, counts, lower_bounds, upper_bounds):
+                if count > 0:
+                    outlier_count += int(count)
                     outlier_details.append({
                         "column": col,
-                        "outlier_count": len(outliers),
-                        "bounds": {"lower": lower_bound, "upper": upper_bound}
+                        "outlier_count": int(count),
+                        "bounds": {"lower": float(lower_bound), "upper": float(upper_bound)}
                     })
 
         return {
@@ -1,5 +1,7 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import exists, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer, raiseload
+from typing import List, Optional, Tuple
 import pandas as pd
 import json
 import uuid
@@ -9,7 +11,15 @@ from pathlib import Path
 from fastapi import UploadFile
 from app.db.models import Dataset, Project as ProjectModel, ProjectDataset, DatasetVersion, Run, Artifact, Log, ModelMeta, PredictionResult
 from app.storage import storage
+from app.services.eda_service import EDAService
+from app.utils.cache import get_cached_json, set_cached_json
+from app.utils.tabular import read_csv, read_parquet, read_parquet_head, read_parquet_metadata, write_parquet
 import numpy as np
+import pyarrow as pa
+from sklearn.preprocessing import StandardScaler
+
+# Object columns are classified from a fixed-size sample of their non-null values
+TYPE_PROBE_ROWS = 10_000
 
 class DatasetService:
     @staticmethod
@@ -24,21 +34,41 @@ class DatasetService:
         """Read DataFrame from file based on extension, supporting multiple formats"""
         if filename is None:
             # Default to CSV if filename is None
-            return pd.read_csv(file_obj)
+            return read_csv(file_obj)
         ext = DatasetService._get_file_extension(filename)
         if ext == '.xlsx' or ext == '.xls':
             return pd.read_excel(file_obj)
         elif ext == '.csv':
-            return pd.read_csv(file_obj)
+            return read_csv(file_obj)
         elif ext == '.json':
             return pd.read_json(file_obj)
         elif ext == '.parquet':
-            return pd.read_parquet(file_obj)
+            return read_parquet(file_obj)
         elif ext == '.feather':
             return pd.read_feather(file_obj)
         else:
             # Default to CSV for backward compatibility
-            return pd.read_csv(file_obj)
+            return read_csv(file_obj)
+
+    @staticmethod
+    def _store_dataframe(df: pd.DataFrame, prefix: str, filename: Optional[str]) -> str:
+        """
+        Write a derived dataset to storage as Snappy-compressed Parquet and return its key.
+        Stored keys carry the format's extension, which is what readers dispatch on.
+        """
+        stem = os.path.splitext(filename or "dataset")[0]
+        try:
+            buffer = write_parquet(df)
+            key = f"{prefix}/{uuid.uuid4()}_{stem}.parquet"
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # An object column mixing value types has no Arrow type; keep such frames as CSV
+            buffer = io.BytesIO()
+            df.to_csv(buffer, index=False)
+            buffer.seek(0)
+            key = f"{prefix}/{uuid.uuid4()}_{stem}.csv"
+        storage.upload_fileobj(key, buffer)
+        return key
+
     @staticmethod
     def link_dataset_to_project(
         dataset_id: str,
@@ -46,31 +76,30 @@ class DatasetService:
         user_id: str,
         db: Session
     ):
-        # Verify project belongs to user
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id, ProjectModel.user_id == user_id).first()
-        if not project:
+        # Project ownership, dataset ownership and an existing link, checked in one round trip
+        checks = db.query(
+            exists().where(ProjectModel.id == project_id, ProjectModel.user_id == user_id).label("project"),
+            exists().where(Dataset.id == dataset_id, Dataset.user_id == user_id).label("dataset"),
+            exists().where(
+                ProjectDataset.project_id == project_id,
+                ProjectDataset.dataset_id == dataset_id
+            ).label("link")
+        ).one()
+        if not checks.project:
             raise ValueError("Project not found")
-
-        # Check if dataset exists and user owns it
-        dataset = db.query(Dataset).filter(
-            Dataset.id == dataset_id,
-            Dataset.user_id == user_id
-        ).first()
-        if not dataset:
+        if not checks.dataset:
             raise ValueError("Dataset not found")
-
-        # Check if link already exists
-        existing_link = db.query(ProjectDataset).filter(
-            ProjectDataset.project_id == project_id,
-            ProjectDataset.dataset_id == dataset_id
-        ).first()
-        if existing_link:
+        if checks.link:
             raise ValueError("Dataset already linked to project")
 
-        # Create link
+        # Create link; the (project_id, dataset_id) primary key catches a concurrent duplicate
         project_dataset = ProjectDataset(project_id=project_id, dataset_id=dataset_id)
         db.add(project_dataset)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise ValueError("Dataset already linked to project")
 
         return {"message": "Dataset linked to project successfully"}
 
@@ -112,33 +141,33 @@ class DatasetService:
             if not project:
                 raise ValueError("Project not found")
 
-        # Generate storage key
-        storage_key = f"datasets/{uuid.uuid4()}_{file.filename}"
-
-        # Save file to storage
-        storage.upload_fileobj(storage_key, file.file)
-
-        # Reset pointer back to 0 so we can read it for validation and type analysis
-        try:
-            file.file.seek(0)
-        except Exception:
-            pass
-
-        # Try to read with pandas for metadata and smart type detection
+        # Parse first, straight from the spooled upload, so rejected files never reach storage
         try:
+            if DatasetService._get_file_extension(file.filename) == '.parquet':
+                # The footer already tells whether there are any rows; skip decoding empty files
+                if read_parquet_metadata(file.file).num_rows == 0:
+                    raise ValueError("Dataset is empty (contains 0 rows)")
+                file.file.seek(0)
             df = DatasetService._read_dataframe_from_file(file.file, file.filename)
             rows, cols = df.shape
             if rows == 0:
                 raise ValueError("Dataset is empty (contains 0 rows)")
             if df.isnull().all().all():
                 raise ValueError("Dataset contains only null/empty values")
-            columns_json = DatasetService._analyze_column_types(df)
+            column_counts = DatasetService._column_counts(df)
+            columns_json = DatasetService._analyze_column_types(df, column_counts)
+            summary_stats = DatasetService._generate_summary_stats(df, column_counts=column_counts)
         except ValueError as e:
             raise e
         except Exception as e:
             # If pandas parsing fails completely, raise ValueError
             raise ValueError(f"Failed to parse dataset file: {str(e)}")
 
+        # Rewind and stream the same spooled file to storage in chunks
+        storage_key = f"datasets/{uuid.uuid4()}_{file.filename}"
+        file.file.seek(0)
+        storage.upload_fileobj(storage_key, file.file)
+
         # Create dataset record with user ownership
         dataset = Dataset(
             user_id=user_id,
@@ -148,22 +177,41 @@ class DatasetService:
             cols=cols,
             columns_json=columns_json
         )
+        DatasetService._set_summary_stats(dataset, summary_stats)
         db.add(dataset)
-        db.commit()
-        db.refresh(dataset)
 
-        # Link dataset to project if project_id provided
+        # Link dataset to project if project_id provided (flush assigns the dataset id),
+        # committed together with the dataset row
         if project_id:
+            db.flush()
             project_dataset = ProjectDataset(project_id=project_id, dataset_id=dataset.id)
             db.add(project_dataset)
-            db.commit()
+        db.commit()
+        db.refresh(dataset)
 
         return dataset
 
     @staticmethod
     def _sanitize_dataframe_for_json(df: pd.DataFrame) -> pd.DataFrame:
-        """Replace NaN, inf, and other non-JSON serializable values with None"""
-        return df.replace([np.inf, -np.inf, np.nan], None)
+        """
+        Make missing and infinite values JSON-safe. Numeric columns keep their dtype and
+        carry NaN for both (orjson writes non-finite floats as null); missing values in
+        other columns (NaT, pd.NA) become None. Returns df itself when nothing needs fixing.
+        """
+        numeric = df.select_dtypes(include="number", exclude="complex")
+        infinite = np.isinf(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+        other_missing = [
+            col for col in df.columns[df.isna().any().to_numpy()] if col not in numeric.columns
+        ]
+        if not infinite.any() and not other_missing:
+            return df
+
+        df = df.copy()
+        if infinite.any():
+            df[numeric.columns] = numeric.mask(infinite)
+        for col in other_missing:
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+        return df
 
     @staticmethod
     def get_dataset_preview(
@@ -179,21 +227,30 @@ class DatasetService:
         if not dataset:
             raise ValueError("Dataset not found")
 
-        # Get file from storage
-        file_obj = storage.download_stream(dataset.storage_key)
         if dataset.filename is None:
             raise ValueError("Dataset filename is missing")
-        df = DatasetService._read_dataframe_from_file(file_obj, dataset.filename)
 
-        # Limit preview to 100 rows for performance
-        preview_df = df.head(100)
+        # With the summary statistics already known only the leading rows are read;
+        # otherwise the whole file is parsed once for both
+        summary_stats = DatasetService._known_summary_stats(dataset, db)
+        if summary_stats is not None:
+            # Limit preview to 100 rows for performance
+            preview_df = DatasetService._read_leading_rows(dataset.storage_key, 100)
+        else:
+            # Get file from storage
+            file_obj = storage.download_stream(dataset.storage_key)
+            df = DatasetService._read_dataframe_from_file(file_obj, dataset.storage_key)
+            # Limit preview to 100 rows for performance
+            preview_df = df.head(100)
+            # Generate summary statistics
+            summary_stats = DatasetService._generate_summary_stats(df, dataset.storage_key)
+            DatasetService._set_summary_stats(dataset, summary_stats)
+            db.commit()
+
         # Sanitize for JSON serialization
         sanitized_df = DatasetService._sanitize_dataframe_for_json(preview_df)
         first_rows = sanitized_df.to_dict('records')
-        columns = list(df.columns)
-
-        # Generate summary statistics
-        summary_stats = DatasetService._generate_summary_stats(df)
+        columns = list(preview_df.columns)
 
         return {
             "columns": columns,
@@ -202,9 +259,27 @@ class DatasetService:
         }
 
     @staticmethod
-    def _generate_summary_stats(df: pd.DataFrame) -> dict:
-        """Generate summary statistics for the dataset"""
-        import numpy as np
+    def _column_counts(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        """
+        Unique and null counts per column, the two whole-frame passes shared by
+        _generate_summary_stats and _analyze_column_types
+        """
+        return df.nunique(), df.isna().sum()
+
+    @staticmethod
+    def _generate_summary_stats(
+        df: pd.DataFrame,
+        storage_key: Optional[str] = None,
+        column_counts: Optional[Tuple[pd.Series, pd.Series]] = None
+    ) -> dict:
+        """
+        Generate summary statistics for the dataset
+        (memoized per stored file when its storage_key is given)
+        """
+        if storage_key:
+            cached = DatasetService._cached_summary_stats(storage_key)
+            if cached is not None:
+                return cached
 
         def safe_float(value):
             """Convert to float, handling NaN and other missing values"""
@@ -221,33 +296,85 @@ class DatasetService:
             "column_stats": {}
         }
 
-        for col in df.columns:
+        # One pass per statistic over the whole frame; the loop below only reads the results
+        unique_counts, null_counts = column_counts or DatasetService._column_counts(df)
+        # An empty frame (e.g. everything removed by cleaning) has no missing values to report;
+        # dividing by zero rows would store NaN, which is not valid JSON
+        null_percentages = (null_counts / len(df) * 100).round(2) if len(df) else null_counts * 0.0
+        numeric_df = df.select_dtypes(include="number", exclude="complex")
+        numeric_desc = numeric_df.describe() if not numeric_df.columns.empty else pd.DataFrame()
+        # For categorical/text columns, show most common values. Object columns can hold
+        # dates, decimals and the like, so keys are stringified to stay valid JSON object keys
+        top_values = {
+            col: {str(value): int(count) for value, count in df[col].value_counts().head(5).items()}
+            for col in df.select_dtypes(include="object").columns
+        }
+
+        for col, dtype in df.dtypes.items():
             col_stats = {
-                "dtype": str(df[col].dtype),
-                "null_count": int(df[col].isnull().sum()),
-                "null_percentage": round((df[col].isnull().sum() / len(df)) * 100, 2),
-                "unique_count": int(df[col].nunique())
+                "dtype": str(dtype),
+                "null_count": int(null_counts[col]),
+                "null_percentage": float(null_percentages[col]),
+                "unique_count": int(unique_counts[col])
             }
 
             # Add type-specific statistics
-            if df[col].dtype in ['int64', 'float64']:
+            if col in numeric_desc.columns:
+                desc = numeric_desc[col]
                 # Handle NaN values properly for JSON serialization
                 col_stats.update({
-                    "mean": safe_float(df[col].mean()),
-                    "median": safe_float(df[col].median()),
-                    "std": safe_float(df[col].std()),
-                    "min": safe_float(df[col].min()),
-                    "max": safe_float(df[col].max())
+                    "mean": safe_float(desc["mean"]),
+                    "median": safe_float(desc["50%"]),
+                    "std": safe_float(desc["std"]),
+                    "min": safe_float(desc["min"]),
+                    "max": safe_float(desc["max"])
                 })
-            elif df[col].dtype == 'object':
-                # For categorical/text columns, show most common values
-                value_counts = df[col].value_counts().head(5)
-                col_stats["top_values"] = value_counts.to_dict()
+            elif col in top_values:
+                col_stats["top_values"] = top_values[col]
 
             stats["column_stats"][col] = col_stats
 
+        if storage_key:
+            set_cached_json(DatasetService._summary_cache_key(storage_key), stats)
         return stats
 
+    @staticmethod
+    def _summary_cache_key(storage_key: str) -> str:
+        # Stored files are never rewritten in place, so the key identifies the content
+        return f"summary:{storage_key}"
+
+    @staticmethod
+    def _cached_summary_stats(storage_key: str) -> Optional[dict]:
+        return get_cached_json(DatasetService._summary_cache_key(storage_key))
+
+    @staticmethod
+    def _set_summary_stats(dataset: Dataset, stats: Optional[dict]) -> None:
+        """Store (or with None, drop) the summary kept on the dataset row under a new version"""
+        dataset.summary_stats_json = stats
+        dataset.summary_stats_version = (dataset.summary_stats_version or 0) + 1
+
+    @staticmethod
+    def _known_summary_stats(dataset: Dataset, db: Session) -> Optional[dict]:
+        """Summary statistics from the dataset row, or from Redis (copied onto the row), without reading the file"""
+        if dataset.summary_stats_json is not None:
+            return dataset.summary_stats_json
+        stats = DatasetService._cached_summary_stats(dataset.storage_key)
+        if stats is not None:
+            DatasetService._set_summary_stats(dataset, stats)
+            db.commit()
+        return stats
+
+    @staticmethod
+    def _read_leading_rows(storage_key: str, n: int) -> pd.DataFrame:
+        """Read the first n rows of a stored file, decoding no more of it than the format requires"""
+        file_obj = storage.download_stream(storage_key)
+        ext = DatasetService._get_file_extension(storage_key)
+        if ext == '.parquet':
+            return read_parquet_head(file_obj, n)
+        if ext == '.csv':
+            return pd.read_csv(file_obj, nrows=n)
+        return DatasetService._read_dataframe_from_file(file_obj, storage_key).head(n)
+
     @staticmethod
     def get_dataset(
         dataset_id: str,
@@ -278,51 +405,55 @@ class DatasetService:
 
         # Load dataset
         file_obj = storage.download_stream(dataset.storage_key)
-        df = DatasetService._read_dataframe_from_file(file_obj, dataset.filename)
+        df = DatasetService._read_dataframe_from_file(file_obj, dataset.storage_key)
 
         # Store original dimensions
         rows_before = df.shape[0]
         cols_before = df.shape[1]
 
-        # Apply cleaning: drop duplicates, fill missing values with smart strategies
-        df_clean = df.drop_duplicates()
+        # Apply cleaning: drop duplicates, fill missing values with smart strategies.
+        # Rows are filtered through boolean masks and the frame is rebound at each step, so
+        # at most one filtered copy exists next to it, and none when nothing is removed.
+        duplicated = df.duplicated()
+        df_clean = df[~duplicated] if duplicated.any() else df
+        del df, duplicated
 
         if options and options.get("fill_na"):
             # Smart filling based on column types
-            for col in df_clean.columns:
-                if df_clean[col].isnull().any():
-                    if df_clean[col].dtype in ['int64', 'float64']:
-                        # For numeric columns, use mean or median based on outliers
-                        if DatasetService._has_outliers(df_clean[col]):
-                            fill_value = df_clean[col].median()
-                        else:
-                            fill_value = df_clean[col].mean()
-                        df_clean[col] = df_clean[col].fillna(fill_value)
-                    else:
-                        # For categorical/text columns, use mode
-                        mode_value = df_clean[col].mode()
-                        if not mode_value.empty:
-                            df_clean[col] = df_clean[col].fillna(mode_value[0])
+            fill_values = {}
+            numeric_cols = set(df_clean.select_dtypes(include="number", exclude="complex").columns)
+            for col in df_clean.columns[df_clean.isna().any().to_numpy()]:
+                if col in numeric_cols:
+                    # For numeric columns, use mean or median based on outliers
+                    fill_values[col] = DatasetService._numeric_fill_value(df_clean[col])
+                else:
+                    # For categorical/text columns, use mode
+                    mode_value = df_clean[col].mode()
+                    if not mode_value.empty:
+                        fill_values[col] = mode_value[0]
+            if fill_values:
+                df_clean = df_clean.fillna(fill_values)
         else:
-            df_clean = df_clean.dropna()
+            incomplete = df_clean.isna().any(axis=1)
+            if incomplete.any():
+                df_clean = df_clean[~incomplete]
+            del incomplete
 
         # Save cleaned dataset
-        cleaned_key = f"cleaned/{uuid.uuid4()}_{dataset.filename}"
-        csv_buffer = io.StringIO()
-        df_clean.to_csv(csv_buffer, index=False)
-        storage.upload_fileobj(cleaned_key, io.BytesIO(csv_buffer.getvalue().encode()))
+        cleaned_key = DatasetService._store_dataframe(df_clean, "cleaned", dataset.filename)
 
         # Update dataset metadata
         dataset.rows = df_clean.shape[0]
         dataset.cols = df_clean.shape[1]
-        dataset.columns_json = DatasetService._analyze_column_types(df_clean)
+        column_counts = DatasetService._column_counts(df_clean)
+        dataset.columns_json = DatasetService._analyze_column_types(df_clean, column_counts)
         dataset.storage_key = cleaned_key  # Update to point to cleaned version
-        db.commit()
+        DatasetService._set_summary_stats(
+            dataset, DatasetService._generate_summary_stats(df_clean, cleaned_key, column_counts)
+        )
 
         # Create version record
-        next_version = db.query(DatasetVersion).filter(
-            DatasetVersion.dataset_id == dataset_id
-        ).count() + 1
+        next_version = DatasetService._next_version_number(dataset_id, db)
 
         changes_summary = f"Cleaned dataset: removed {rows_before - df_clean.shape[0]} duplicate rows"
         if options and options.get("fill_na"):
@@ -342,10 +473,24 @@ class DatasetService:
             cols_after=df_clean.shape[1]
         )
         db.add(version)
+        # The repointed dataset and its version row are committed together
         db.commit()
+        EDAService.invalidate_combined_cache(dataset_id)
 
         return {"message": "Dataset cleaned", "dataset_id": dataset_id, "rows": dataset.rows, "cols": dataset.cols, "version": next_version}
 
+    @staticmethod
+    def _next_version_number(dataset_id: str, db: Session) -> int:
+        """
+        Next version number for a dataset: MAX + 1, read while holding the dataset row lock
+        (FOR UPDATE, where the database supports it) so concurrent writers queue up. The
+        unique (dataset_id, version_number) index rejects anything that slips through.
+        """
+        db.query(Dataset.id).filter(Dataset.id == dataset_id).with_for_update().one()
+        return db.query(
+            func.coalesce(func.max(DatasetVersion.version_number), 0) + 1
+        ).filter(DatasetVersion.dataset_id == dataset_id).scalar()
+
     @staticmethod
     def get_dataset_versions(dataset_id: str, user_id: str, db: Session) -> List[dict]:
         """
@@ -400,7 +545,9 @@ class DatasetService:
         dataset.storage_key = version.storage_key
         dataset.rows = version.rows_after
         dataset.cols = version.cols_after
+        DatasetService._set_summary_stats(dataset, None)
         db.commit()
+        EDAService.invalidate_combined_cache(dataset_id)
 
         return {
             "message": f"Dataset rolled back to version {version.version_number}",
@@ -409,19 +556,24 @@ class DatasetService:
         }
 
     @staticmethod
-    def _has_outliers(series: pd.Series) -> bool:
-        """Check if a numeric series has outliers using IQR method"""
-        if series.dtype not in ['int64', 'float64']:
-            return False
+    def _numeric_fill_value(series: pd.Series) -> float:
+        """
+        Fill value for a numeric column: the median if it has outliers by the IQR method,
+        otherwise the mean. The median comes from the same quantile call as the quartiles.
+        """
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan, copy=False)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return np.nan
 
-        Q1 = series.quantile(0.25)
-        Q3 = series.quantile(0.75)
+        Q1, median, Q3 = np.quantile(values, [0.25, 0.5, 0.75])
         IQR = Q3 - Q1
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
 
-        outliers = series[(series < lower_bound) | (series > upper_bound)]
-        return len(outliers) > 0
+        if ((values < lower_bound) | (values > upper_bound)).any():
+            return float(median)
+        return float(values.mean())
 
     @staticmethod
     def transform_dataset(
@@ -439,23 +591,26 @@ class DatasetService:
 
         # Load dataset
         file_obj = storage.download_stream(dataset.storage_key)
-        df = DatasetService._read_dataframe_from_file(file_obj, dataset.filename)
+        df = DatasetService._read_dataframe_from_file(file_obj, dataset.storage_key)
 
         # Apply transformations
         if options:
             if options.get("normalize"):
                 numeric_cols = df.select_dtypes(include=['number']).columns
-                df[numeric_cols] = (df[numeric_cols] - df[numeric_cols].mean()) / df[numeric_cols].std()
+                if len(numeric_cols) > 0:
+                    # Mean and variance in one sweep, scaled in place on the float64 block
+                    # (NaNs are ignored when fitting and stay NaN)
+                    scaler = StandardScaler(copy=False)
+                    df[numeric_cols] = scaler.fit_transform(
+                        df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+                    )
             if options.get("encode_categorical"):
                 categorical_cols = df.select_dtypes(include=['object']).columns
                 for col in categorical_cols:
                     df[col] = pd.Categorical(df[col]).codes
 
         # Save transformed dataset
-        transformed_key = f"transformed/{uuid.uuid4()}_{dataset.filename}"
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        storage.upload_fileobj(transformed_key, io.BytesIO(csv_buffer.getvalue().encode()))
+        DatasetService._store_dataframe(df, "transformed", dataset.filename)
 
         # Update dataset metadata
         dataset.rows = df.shape[0]
@@ -478,27 +633,22 @@ class DatasetService:
         if not dataset:
             raise ValueError("Dataset not found")
 
-        # Delete related records first to avoid foreign key constraint issues
+        # Delete related records first to avoid foreign key constraint issues.
+        # One set-based DELETE per table, whatever the number of runs and models.
         # Delete ProjectDataset links
-        db.query(ProjectDataset).filter(ProjectDataset.dataset_id == dataset_id).delete()
+        db.query(ProjectDataset).filter(ProjectDataset.dataset_id == dataset_id).delete(synchronize_session=False)
 
         # Delete DatasetVersion records
-        db.query(DatasetVersion).filter(DatasetVersion.dataset_id == dataset_id).delete()
+        db.query(DatasetVersion).filter(DatasetVersion.dataset_id == dataset_id).delete(synchronize_session=False)
 
         # Delete related Run records and their dependencies
-        runs = db.query(Run).filter(Run.dataset_id == dataset_id).all()
-        for run in runs:
-            # Delete Artifacts
-            db.query(Artifact).filter(Artifact.run_id == run.id).delete()
-            # Delete Logs
-            db.query(Log).filter(Log.run_id == run.id).delete()
-            # Delete ModelMetas and their PredictionResults
-            model_metas = db.query(ModelMeta).filter(ModelMeta.run_id == run.id).all()
-            for model_meta in model_metas:
-                db.query(PredictionResult).filter(PredictionResult.model_id == model_meta.id).delete()
-            db.query(ModelMeta).filter(ModelMeta.run_id == run.id).delete()
-            # Delete the Run itself
-            db.delete(run)
+        run_ids = db.query(Run.id).filter(Run.dataset_id == dataset_id).scalar_subquery()
+        model_ids = db.query(ModelMeta.id).filter(ModelMeta.run_id.in_(run_ids)).scalar_subquery()
+        db.query(PredictionResult).filter(PredictionResult.model_id.in_(model_ids)).delete(synchronize_session=False)
+        db.query(ModelMeta).filter(ModelMeta.run_id.in_(run_ids)).delete(synchronize_session=False)
+        db.query(Artifact).filter(Artifact.run_id.in_(run_ids)).delete(synchronize_session=False)
+        db.query(Log).filter(Log.run_id.in_(run_ids)).delete(synchronize_session=False)
+        db.query(Run).filter(Run.dataset_id == dataset_id).delete(synchronize_session=False)
 
         # Delete from storage
         storage.delete_file(dataset.storage_key)
@@ -506,6 +656,7 @@ class DatasetService:
         # Delete from database
         db.delete(dataset)
         db.commit()
+        EDAService.invalidate_combined_cache(dataset_id)
 
         return {"message": "Dataset deleted successfully"}
 
@@ -518,50 +669,37 @@ class DatasetService:
         limit: int = 20
     ):
         offset = (page - 1) * limit
+        # Listings serialize only the dataset's own columns: skip the stored summary and
+        # make any relationship access fail loudly instead of issuing a query per row
+        query = db.query(Dataset).options(defer(Dataset.summary_stats_json), raiseload("*"))
         if project_id:
             # Verify project belongs to user
             project = db.query(ProjectModel).filter(ProjectModel.id == project_id, ProjectModel.user_id == user_id).first()
             if not project:
                 raise ValueError("Project not found")
-            datasets = db.query(Dataset).join(ProjectDataset).filter(ProjectDataset.project_id == project_id).offset(offset).limit(limit).all()
-        else:
-            datasets = db.query(Dataset).filter(Dataset.user_id == user_id).offset(offset).limit(limit).all()
+            query = query.join(ProjectDataset).filter(ProjectDataset.project_id == project_id)
+        datasets = query.filter(Dataset.user_id == user_id).offset(offset).limit(limit).all()
         return datasets
 
     @staticmethod
-    def _analyze_column_types(df: pd.DataFrame) -> dict:
+    def _analyze_column_types(df: pd.DataFrame, column_counts: Optional[Tuple[pd.Series, pd.Series]] = None) -> dict:
         """
         Analyze column types and provide smart type detection
         Returns a dictionary with column names as keys and type info as values
         """
         column_analysis = {}
+        total_count = len(df)
+        unique_counts, null_counts = column_counts or DatasetService._column_counts(df)
+        numeric_cols = set(df.select_dtypes(include="number", exclude="complex").columns)
 
-        for col in df.columns:
-            dtype = df[col].dtype
-            unique_count = df[col].nunique()
-            total_count = len(df)
-            null_count = df[col].isnull().sum()
+        for col, dtype in df.dtypes.items():
+            unique_count = unique_counts[col]
+            null_count = null_counts[col]
 
-            # Basic type detection with better handling
+            # Only text columns need value-level inference; typed columns are classified by dtype
             if dtype == 'object':
-                # Check if it's actually numeric
-                try:
-                    numeric_conversion = pd.to_numeric(df[col], errors='coerce')
-                    if numeric_conversion.notna().sum() > 0.8 * total_count:  # 80% convertible
-                        inferred_type = 'numeric_string'
-                    else:
-                        inferred_type = 'text'
-                except:
-                    # Check if it's datetime
-                    try:
-                        datetime_conversion = pd.to_datetime(df[col], errors='coerce')
-                        if datetime_conversion.notna().sum() > 0.8 * total_count:
-                            inferred_type = 'datetime_string'
-                        else:
-                            inferred_type = 'categorical' if unique_count < total_count * 0.5 else 'text'
-                    except:
-                        inferred_type = 'categorical' if unique_count < total_count * 0.5 else 'text'
-            elif dtype in ['int64', 'float64']:
+                inferred_type = DatasetService._infer_object_type(df[col], unique_count, total_count)
+            elif col in numeric_cols:
                 # Check if it's actually categorical (few unique values)
                 if unique_count <= 10 and total_count > 50:
                     inferred_type = 'categorical_numeric'
@@ -582,6 +720,33 @@ class DatasetService:
 
         return column_analysis
 
+    @staticmethod
+    def _infer_object_type(series: pd.Series, unique_count: int, total_count: int) -> str:
+        """
+        Detect what an object column actually holds. The conversion probes run on a sample
+        of the non-null values; the converted share is scaled back up to the whole column.
+        """
+        values = series.dropna()
+        probe = values if len(values) <= TYPE_PROBE_ROWS else values.sample(TYPE_PROBE_ROWS, random_state=0)
+
+        def mostly_convertible(converted: pd.Series) -> bool:
+            # 80% of all rows (nulls included) convertible
+            return len(probe) > 0 and converted.notna().mean() * len(values) > 0.8 * total_count
+
+        # Check if it's actually numeric
+        try:
+            if mostly_convertible(pd.to_numeric(probe, errors='coerce')):
+                return 'numeric_string'
+        except (ValueError, TypeError):
+            pass
+        # Check if it's datetime
+        try:
+            if mostly_convertible(pd.to_datetime(probe, errors='coerce', format='mixed')):
+                return 'datetime_string'
+        except (ValueError, TypeError, OverflowError):
+            pass
+        return 'categorical' if unique_count < total_count * 0.5 else 'text'
+
     @staticmethod
     def analyze_types(dataset_id: str, user_id: str, db: Session) -> dict:
         """
@@ -594,16 +759,20 @@ class DatasetService:
         if not dataset:
             raise ValueError("Dataset not found")
 
-        # Load dataset
-        file_obj = storage.download_stream(dataset.storage_key)
-        df = DatasetService._read_dataframe_from_file(file_obj, dataset.filename)
+        # Upload, clean and feature engineering already store the analysis; transform leaves
+        # plain dtype names behind, and only then is the file read again
+        analysis = dataset.columns_json
+        if not analysis or not all(isinstance(info, dict) for info in analysis.values()):
+            # Load dataset
+            file_obj = storage.download_stream(dataset.storage_key)
+            df = DatasetService._read_dataframe_from_file(file_obj, dataset.storage_key)
 
-        # Analyze types
-        analysis = DatasetService._analyze_column_types(df)
+            # Analyze types
+            analysis = DatasetService._analyze_column_types(df)
 
-        # Update dataset with analysis
-        dataset.columns_json = analysis
-        db.commit()
+            # Update dataset with analysis
+            dataset.columns_json = analysis
+            db.commit()
 
         return {
             "dataset_id": dataset_id,
@@ -619,9 +788,8 @@ class DatasetService:
     ):
         """
         Get summary statistics for a dataset
+        (derived from the stored summary; the file is only read when there is none yet)
         """
-        import numpy as np
-
         dataset = db.query(Dataset).filter(
             Dataset.id == dataset_id,
             Dataset.user_id == user_id
@@ -629,31 +797,31 @@ class DatasetService:
         if not dataset:
             raise ValueError("Dataset not found")
 
-        # Load dataset
-        file_obj = storage.download_stream(dataset.storage_key)
-        df = DatasetService._read_dataframe_from_file(file_obj, dataset.filename)
-
-        # Generate summary statistics
-        summary_stats = DatasetService._generate_summary_stats(df)
+        summary_stats = DatasetService._known_summary_stats(dataset, db)
+        if summary_stats is None:
+            # Load dataset
+            file_obj = storage.download_stream(dataset.storage_key)
+            df = DatasetService._read_dataframe_from_file(file_obj, dataset.storage_key)
 
-        def safe_float(value):
-            """Convert to float, handling NaN values"""
-            if isinstance(value, (int, float)) and not np.isnan(value):
-                return float(value)
-            return None
+            # Generate summary statistics
+            summary_stats = DatasetService._generate_summary_stats(df, dataset.storage_key)
+            DatasetService._set_summary_stats(dataset, summary_stats)
+            db.commit()
 
+        total_rows = summary_stats["total_rows"]
+        column_stats = summary_stats["column_stats"]
         return {
-            "total_rows": len(df),
-            "total_columns": len(df.columns),
-            "column_types": {col: str(df[col].dtype) for col in df.columns},
-            "missing_values": {col: int(df[col].isnull().sum()) for col in df.columns},
+            "total_rows": total_rows,
+            "total_columns": summary_stats["total_columns"],
+            "column_types": {col: stats["dtype"] for col, stats in column_stats.items()},
+            "missing_values": {col: stats["null_count"] for col, stats in column_stats.items()},
             "statistics": {
                 col: {
-                    "mean": safe_float(df[col].mean()) if df[col].dtype in ['int64', 'float64'] and not df[col].isnull().all() else None,
-                    "std": safe_float(df[col].std()) if df[col].dtype in ['int64', 'float64'] and not df[col].isnull().all() else None,
-                    "min": safe_float(df[col].min()) if df[col].dtype in ['int64', 'float64'] and not df[col].isnull().all() else None,
-                    "max": safe_float(df[col].max()) if df[col].dtype in ['int64', 'float64'] and not df[col].isnull().all() else None,
-                    "count": int(df[col].count())
-                } for col in df.columns if df[col].dtype in ['int64', 'float64']
+                    "mean": stats["mean"],
+                    "std": stats["std"],
+                    "min": stats["min"],
+                    "max": stats["max"],
+                    "count": total_rows - stats["null_count"]
+                } for col, stats in column_stats.items() if "mean" in stats
             }
         }
@@ -1,10 +1,31 @@
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any
 import pandas as pd
-import json
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+import orjson
+import warnings
 import uuid
+import hashlib
 from app.db.models import Project as ProjectModel, Dataset, ProjectDataset
 from app.storage import storage
+from app.utils.cache import get_cached_json, set_cached_json
+from app.utils.profiling import profile_dataframe
+from app.utils.tabular import read_frame, read_table
+from concurrent.futures import ThreadPoolExecutor
+
+DATASET_LOAD_MAX_WORKERS = 8
+COMBINED_CACHE_PREFIX = "cache/combined/v2/"
+# Empty marker objects, one per (dataset, combined table) pair, so the tables that contain
+# a dataset can be found and deleted when it is deleted or its stored file changes
+COMBINED_CACHE_INDEX_PREFIX = f"{COMBINED_CACHE_PREFIX}by-dataset/"
+# Schema metadata on a cached table: [[dataset_id, row_count], ...] in concatenation order
+COMBINED_PARTS_METADATA_KEY = b"uam_parts"
+
+# Report payloads embed the full profiling JSON; orjson encodes straight to bytes
+# (no intermediate str + encode copy) and handles NumPy scalars and non-string keys
+EDA_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
 
 class EDAService:
     @staticmethod
@@ -12,10 +33,12 @@ class EDAService:
         project_id: str,
         user_id: str,
         db: Session,
-        dataset_ids: Optional[list] = None
+        dataset_ids: Optional[list] = None,
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Generate comprehensive EDA report for a project using ydata-profiling
+        (cached per set of stored dataset files)
         """
         # Verify project ownership
         project = db.query(ProjectModel).filter(
@@ -43,21 +66,22 @@ class EDAService:
         if not datasets:
             raise ValueError("No datasets found for this project")
 
+        # Stored files are never rewritten in place, so their keys identify the inputs
+        cache_key = f"eda:{project_id}:" + "|".join(sorted(d.storage_key for d in datasets))
+        cached = None if bypass_cache else get_cached_json(cache_key)
+        if cached is not None:
+            return cached
+
         # Combine all datasets for analysis
         combined_df = EDAService._combine_datasets(datasets)
 
-        # Generate ydata-profiling report with error handling
+        # Generate ydata-profiling report with error handling (isolated process, bounded time)
         profile_report_data = None
         try:
-            from ydata_profiling import ProfileReport
-            profile = ProfileReport(
-                combined_df,
-                title=f"EDA Report - {project.name}",
-                explorative=True,
-                minimal=True  # Use minimal mode to avoid complex computations
+            profile_report_data = profile_dataframe(
+                EDAService._downcast_numeric(combined_df),
+                title=f"EDA Report - {project.name}"
             )
-            profile_json = profile.to_json()
-            profile_report_data = json.loads(profile_json)
         except Exception as e:
             print(f"Warning: ydata-profiling failed: {e}. Using fallback analysis.")
             # Fallback: generate basic profile manually
@@ -79,11 +103,11 @@ class EDAService:
         # Save to storage
         storage_key = f"eda/{project_id}_{uuid.uuid4()}.json"
         import io
-        storage.upload_fileobj(storage_key, io.BytesIO(json.dumps(eda_results).encode('utf-8')))
+        storage.upload_fileobj(storage_key, io.BytesIO(orjson.dumps(eda_results, option=EDA_JSON_OPTIONS)))
 
         # TODO: Store in database table (will be added in Phase 4)
 
-        return {
+        result = {
             "project_id": project_id,
             "storage_key": storage_key,
             "insights": insights,
@@ -91,6 +115,8 @@ class EDAService:
             "total_rows": len(combined_df),
             "total_columns": len(combined_df.columns)
         }
+        set_cached_json(cache_key, result)
+        return result
 
     @staticmethod
     def get_eda_results(
@@ -145,26 +171,88 @@ class EDAService:
     def _combine_datasets(datasets: list) -> pd.DataFrame:
         """
         Combine multiple datasets into a single DataFrame for analysis
+        (the combined table is cached in storage as LZ4 Feather, keyed by the stored files)
         """
-        dfs = []
-        for dataset in datasets:
+        # Stored files are never rewritten in place, so their keys identify the combined content.
+        # The key does not depend on the order datasets are passed in; rows always come back
+        # in the caller's order.
+        digest = hashlib.sha256("|".join(sorted(f"{d.id}:{d.storage_key}" for d in datasets)).encode()).hexdigest()
+        cache_key = f"{COMBINED_CACHE_PREFIX}{digest}.feather"
+        try:
+            cached = feather.read_table(pa.BufferReader(storage.download_stream(cache_key).read()))
+            cached = EDAService._reorder_combined(cached, [d.id for d in datasets])
+            return cached.to_pandas(self_destruct=True, split_blocks=True)
+        except Exception:
+            pass  # Not combined yet (or unreadable): build it from the CSVs
+
+        # No per-row dataset id/name columns: nothing reads them back, and as constant
+        # columns they skewed the column counts, profile and duplicate check of the analysis
+        def load(dataset):
             try:
-                file_obj = storage.download_stream(dataset.storage_key)
-                df = pd.read_csv(file_obj)
-                # Add dataset identifier column
-                df['_dataset_id'] = dataset.id
-                df['_dataset_name'] = dataset.filename
-                dfs.append(df)
+                return read_table(dataset.storage_key, lambda: storage.download_stream(dataset.storage_key))
             except Exception as e:
                 print(f"Error loading dataset {dataset.id}: {e}")
-                continue
+                return None
+
+        # Downloads and CSV parsing release the GIL, so datasets load in parallel (order preserved)
+        with ThreadPoolExecutor(max_workers=min(DATASET_LOAD_MAX_WORKERS, max(len(datasets), 1))) as executor:
+            tables = [table for table in executor.map(load, datasets) if table is not None]
 
-        if not dfs:
+        if not tables:
             raise ValueError("No datasets could be loaded")
 
-        # Combine all DataFrames
-        combined_df = pd.concat(dfs, ignore_index=True, sort=False)
-        return combined_df
+        # Concatenating Arrow tables only chains the column chunks; the single pandas
+        # conversion at the end is the one full copy, and it frees the Arrow buffers as it goes
+        try:
+            combined = pa.concat_tables(tables, promote_options="permissive")
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Same column holding incompatible types across datasets: let pandas upcast to object
+            return pd.concat([table.to_pandas() for table in tables], ignore_index=True, sort=False)
+        complete = len(tables) == len(datasets)
+        parts = [[d.id, table.num_rows] for d, table in zip(datasets, tables)]
+        del tables
+
+        # Only cache a combine in which every dataset loaded
+        if complete:
+            try:
+                metadata = dict(combined.schema.metadata or {})
+                metadata[COMBINED_PARTS_METADATA_KEY] = orjson.dumps(parts)
+                sink = pa.BufferOutputStream()
+                feather.write_feather(combined.replace_schema_metadata(metadata), sink, compression="lz4")
+                storage.upload_fileobj(cache_key, pa.BufferReader(sink.getvalue()))
+                for dataset in datasets:
+                    storage.put_object(f"{COMBINED_CACHE_INDEX_PREFIX}{dataset.id}/{digest}", b"")
+            except Exception as e:
+                print(f"Warning: Failed to cache combined datasets: {e}")
+        return combined.to_pandas(self_destruct=True, split_blocks=True)
+
+    @staticmethod
+    def _reorder_combined(table: pa.Table, dataset_ids: list) -> pa.Table:
+        """Rearrange a cached combined table's per-dataset row blocks into dataset_ids order"""
+        parts = orjson.loads(table.schema.metadata[COMBINED_PARTS_METADATA_KEY])
+        if [dataset_id for dataset_id, _ in parts] == dataset_ids:
+            return table
+        # Slices are zero-copy views; concatenating them only chains the chunks
+        blocks = {}
+        offset = 0
+        for dataset_id, num_rows in parts:
+            blocks[dataset_id] = table.slice(offset, num_rows)
+            offset += num_rows
+        return pa.concat_tables([blocks[dataset_id] for dataset_id in dataset_ids])
+
+    @staticmethod
+    def invalidate_combined_cache(dataset_id: str) -> None:
+        """
+        Delete every cached combined table that includes the dataset. Call when the dataset
+        is deleted or its storage_key changes; failures are logged, never raised.
+        """
+        try:
+            for marker_key in storage.list_prefix(f"{COMBINED_CACHE_INDEX_PREFIX}{dataset_id}/"):
+                digest = marker_key.rsplit("/", 1)[-1]
+                storage.delete_file(f"{COMBINED_CACHE_PREFIX}{digest}.feather")
+                storage.delete_file(marker_key)
+        except Exception as e:
+            print(f"Warning: Failed to invalidate combined dataset cache for {dataset_id}: {e}")
 
     @staticmethod
     def _generate_insights(df: pd.DataFrame) -> Dict[str, Any]:
@@ -182,84 +270,76 @@ class EDAService:
         total_rows = len(df)
         total_cols = len(df.columns)
 
+        # Duplicates from one uint64 hash per row instead of a column-by-column row comparison
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        duplicate_rows = len(row_hashes) - len(np.unique(row_hashes))
+
+        missing_by_column = df.isnull().sum()
+
         insights["data_quality"] = {
             "total_rows": total_rows,
             "total_columns": total_cols,
-            "missing_data_percentage": round((df.isnull().sum().sum() / (total_rows * total_cols)) * 100, 2),
-            "duplicate_rows": int(df.duplicated().sum()),
-            "columns_with_missing": int((df.isnull().sum() > 0).sum())
+            "missing_data_percentage": round((missing_by_column.sum() / (total_rows * total_cols)) * 100, 2),
+            "duplicate_rows": int(duplicate_rows),
+            "columns_with_missing": int((missing_by_column > 0).sum())
         }
 
         # Correlation analysis for numeric columns (excluding complex types)
         numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_complex_dtype(df[col])]
         if len(numeric_cols) > 1:
             try:
-                corr_matrix = df[numeric_cols].corr()
-                # Get top correlations
-                top_correlations = []
-                for i in range(len(numeric_cols)):
-                    for j in range(i+1, len(numeric_cols)):
-                        corr_value = corr_matrix.iloc[i, j]
-                        # Handle different types of correlation values
-                        if pd.isna(corr_value):
-                            continue
-                        try:
-                            # Convert to numeric, handling complex numbers
-                            numeric_corr = pd.to_numeric(corr_value, errors='coerce')
-                            if pd.isna(numeric_corr):
-                                continue
-                            if isinstance(numeric_corr, complex):
-                                corr_value = float(numeric_corr.real)
-                            else:
-                                corr_value = float(numeric_corr)
-                        except (TypeError, ValueError, AttributeError):
-                            continue
-                        if abs(corr_value) > 0.5:  # Only significant correlations
-                            top_correlations.append({
-                                "col1": numeric_cols[i],
-                                "col2": numeric_cols[j],
-                                "correlation": round(corr_value, 3)
-                            })
-
-                top_correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
-                insights["correlations"]["top_correlations"] = top_correlations[:10]  # Top 10
+                values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+                if np.isnan(values).any():
+                    # pandas handles missing values pairwise; np.corrcoef would poison whole columns
+                    corr_matrix = df[numeric_cols].corr().to_numpy()
+                else:
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        corr_matrix = np.corrcoef(values, rowvar=False)
+
+                # Get top correlations from the upper triangle in one vectorized pass
+                rows, cols = np.triu_indices(len(numeric_cols), k=1)
+                corr_values = corr_matrix[rows, cols]
+                significant = np.isfinite(corr_values) & (np.abs(corr_values) > 0.5)  # Only significant correlations
+                rows, cols, corr_values = rows[significant], cols[significant], corr_values[significant]
+                # Top 10: partial selection in O(K), then sort only the selected pairs
+                strength = np.abs(corr_values)
+                order = np.arange(len(strength))
+                if len(strength) > 10:
+                    order = np.sort(np.argpartition(-strength, 9)[:10])
+                order = order[np.argsort(-strength[order], kind='stable')]
+
+                insights["correlations"]["top_correlations"] = [
+                    {
+                        "col1": numeric_cols[i],
+                        "col2": numeric_cols[j],
+                        "correlation": round(float(corr_value), 3)
+                    }
+                    for i, j, corr_value in zip(rows[order], cols[order], corr_values[order])
+                ]
             except Exception as e:
                 print(f"Warning: Correlation analysis failed: {e}")
                 insights["correlations"]["error"] = "Correlation analysis failed"
 
         # Distribution insights
         insights["distributions"] = {}
-        for col in numeric_cols[:5]:  # Analyze first 5 numeric columns
+        distribution_cols = numeric_cols[:5]  # Analyze first 5 numeric columns
+        # The median comes from the same quantile call as the outlier fences
+        values, quartiles, _, _, outlier_mask = EDAService._iqr_outliers(df, distribution_cols)
+        if distribution_cols:
             try:
-                col_data = pd.to_numeric(df[col], errors='coerce').dropna()
-                if len(col_data) > 0:
-                    # Safely convert statistics to float
-                    def safe_float(value):
-                        if pd.isna(value):
-                            return 0.0
-                        try:
-                            # Convert to numeric first, then handle special cases
-                            numeric_value = pd.to_numeric(value, errors='coerce')
-                            if pd.isna(numeric_value):
-                                return 0.0
-                            # Handle complex numbers
-                            if isinstance(numeric_value, complex):
-                                return float(numeric_value.real)
-                            return float(numeric_value)
-                        except (TypeError, ValueError, AttributeError, OverflowError):
-                            return 0.0
-
-                    insights["distributions"][col] = {
-                        "mean": round(safe_float(col_data.mean()), 2),
-                        "median": round(safe_float(col_data.median()), 2),
-                        "std": round(safe_float(col_data.std()), 2),
-                        "skewness": round(safe_float(col_data.skew()), 2),
-                        "kurtosis": round(safe_float(col_data.kurtosis()), 2),
-                        "outliers_count": EDAService._detect_outliers(col_data)
-                    }
+                stats = EDAService._moments(values)
+                for idx, col in enumerate(distribution_cols):
+                    if stats['count'][idx] > 0:
+                        insights["distributions"][col] = {
+                            "mean": round(EDAService._finite_or_zero(stats['mean'][idx]), 2),
+                            "median": round(EDAService._finite_or_zero(quartiles[1][idx]), 2),
+                            "std": round(EDAService._finite_or_zero(stats['std'][idx]), 2),
+                            "skewness": round(EDAService._finite_or_zero(stats['skew'][idx]), 2),
+                            "kurtosis": round(EDAService._finite_or_zero(stats['kurt'][idx]), 2),
+                            "outliers_count": int(outlier_mask[:, idx].sum())
+                        }
             except Exception as e:
-                print(f"Warning: Failed to analyze distribution for column {col}: {e}")
-                continue
+                print(f"Warning: Failed to analyze distributions: {e}")
 
         # Generate recommendations
         recommendations = []
@@ -307,18 +387,71 @@ class EDAService:
         return insights
 
     @staticmethod
-    def _detect_outliers(series: pd.Series) -> int:
+    def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
         """
-        Detect outliers using IQR method
+        Narrow float64/int64 columns for the profiler, which scans numeric columns several times.
+        Other columns are shared with the input frame, which is left at full precision.
         """
-        Q1 = series.quantile(0.25)
-        Q3 = series.quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
+        downcast = {col: 'float32' for col in df.select_dtypes(include=['float64']).columns}
+        for col in df.select_dtypes(include=['int64']).columns:
+            downcast[col] = pd.to_numeric(df[col], downcast='integer').dtype
+        return df.astype(downcast, copy=False) if downcast else df
+
+    @staticmethod
+    def _finite_or_zero(value) -> float:
+        """Statistics that are undefined for a column (e.g. std of one value) are reported as 0.0"""
+        value = float(value)
+        return value if np.isfinite(value) else 0.0
+
+    @staticmethod
+    def _moments(values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Count, mean, std, skew and kurtosis per column of a float block, ignoring NaNs.
+        The central moments share one deviation array; std, skew and kurt carry the same
+        sample-size corrections as pandas.
+        """
+        valid = ~np.isnan(values)
+        n = valid.sum(axis=0).astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(valid, values, 0.0).sum(axis=0) / n
+            dev = np.where(valid, values - mean, 0.0)
+            dev2 = dev * dev
+            m2 = dev2.sum(axis=0) / n
+            m3 = (dev2 * dev).sum(axis=0) / n
+            m4 = (dev2 * dev2).sum(axis=0) / n
+            std = np.sqrt(m2 * n / (n - 1))
+            skew = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+            kurt = ((n + 1) * (m4 / (m2 * m2) - 3) + 6) * (n - 1) / ((n - 2) * (n - 3))
+        constant = m2 == 0
+        return {
+            "count": n,
+            "mean": mean,
+            "std": std,
+            "skew": np.where(n < 3, np.nan, np.where(constant, 0.0, skew)),
+            "kurt": np.where(n < 4, np.nan, np.where(constant, 0.0, kurt))
+        }
 
-        outliers = series[(series < lower_bound) | (series > upper_bound)]
-        return len(outliers)
+    @staticmethod
+    def _iqr_outliers(df: pd.DataFrame, columns: list) -> tuple:
+        """
+        Detect outliers using IQR method for several numeric columns in one vectorized pass.
+        Returns (values, quartiles, lower_bounds, upper_bounds, outlier_mask), where quartiles
+        holds the 25th/50th/75th percentile rows; NaNs are never outliers.
+        """
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        if values.shape[1] == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return values, np.empty((3, 0), dtype=np.float64), empty, empty, np.zeros(values.shape, dtype=bool)
+        with warnings.catch_warnings():
+            # All-NaN columns yield NaN fences, which flag nothing
+            warnings.simplefilter("ignore", RuntimeWarning)
+            quartiles = np.nanpercentile(values, [25, 50, 75], axis=0)
+        Q1, Q3 = quartiles[0], quartiles[2]
+        IQR = Q3 - Q1
+        lower_bounds = Q1 - 1.5 * IQR
+        upper_bounds = Q3 + 1.5 * IQR
+        outlier_mask = (values < lower_bounds) | (values > upper_bounds)
+        return values, quartiles, lower_bounds, upper_bounds, outlier_mask
 
     @staticmethod
     def _generate_outliers_data(df: pd.DataFrame) -> Dict[str, Any]:
@@ -327,30 +460,27 @@ class EDAService:
         """
         outliers_data = {}
         numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_complex_dtype(df[col])]
+        outlier_cols = numeric_cols[:5]  # Analyze first 5 numeric columns
 
-        for col in numeric_cols[:5]:  # Analyze first 5 numeric columns
-            try:
-                col_data = pd.to_numeric(df[col], errors='coerce').dropna()
-                if len(col_data) > 0:
-                    # Detect outliers using IQR method
-                    Q1 = col_data.quantile(0.25)
-                    Q3 = col_data.quantile(0.75)
-                    IQR = Q3 - Q1
-                    lower_bound = Q1 - 1.5 * IQR
-                    upper_bound = Q3 + 1.5 * IQR
+        # Detect outliers using IQR method, all columns at once
+        values, _, lower_bounds, upper_bounds, outlier_mask = EDAService._iqr_outliers(df, outlier_cols)
+        non_null_counts = (~np.isnan(values)).sum(axis=0)
 
+        for idx, col in enumerate(outlier_cols):
+            try:
+                if non_null_counts[idx] > 0:
                     # Get outlier values and their indices
-                    outlier_mask = (col_data < lower_bound) | (col_data > upper_bound)
-                    outlier_values = col_data[outlier_mask].tolist()
-                    outlier_indices = col_data[outlier_mask].index.tolist()
+                    col_mask = outlier_mask[:, idx]
+                    outlier_values = values[col_mask, idx]
+                    outlier_indices = df.index[col_mask]
 
                     outliers_data[col] = {
-                        "count": len(outlier_values),
-                        "lower_bound": round(float(lower_bound), 2),
-                        "upper_bound": round(float(upper_bound), 2),
+                        "count": int(col_mask.sum()),
+                        "lower_bound": round(float(lower_bounds[idx]), 2),
+                        "upper_bound": round(float(upper_bounds[idx]), 2),
                         "outlier_values": [round(float(v), 2) for v in outlier_values[:10]],  # Limit to first 10 outliers
-                        "outlier_indices": outlier_indices[:10],  # Corresponding indices
-                        "percentage": round((len(outlier_values) / len(col_data)) * 100, 2)
+                        "outlier_indices": outlier_indices[:10].tolist(),  # Corresponding indices
+                        "percentage": round((int(col_mask.sum()) / int(non_null_counts[idx])) * 100, 2)
                     }
             except Exception as e:
                 print(f"Warning: Failed to analyze outliers for column {col}: {e}")
@@ -363,43 +493,54 @@ class EDAService:
         """
         Generate a basic profile report when ydata-profiling fails
         """
+        # Column statistics are computed for all columns at once and only read back per column
+        missing_by_column = df.isnull().sum()
+        unique_by_column = df.nunique()
+        total_missing = missing_by_column.sum()
+
         profile = {
             "summary": {
                 "table": {
                     "n": len(df),
                     "nvar": len(df.columns),
-                    "total_missing": df.isnull().sum().sum(),
-                    "percentage_missing": round((df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100, 2)
+                    "total_missing": total_missing,
+                    "percentage_missing": round((total_missing / (len(df) * len(df.columns))) * 100, 2)
                 }
             },
             "variables": {}
         }
 
+        numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_complex_dtype(df[col])]
+        values, quartiles, _, _, _ = EDAService._iqr_outliers(df, numeric_cols)
+        stats = EDAService._moments(values)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            minimums = np.nanmin(values, axis=0) if len(values) else np.full(len(numeric_cols), np.nan)
+            maximums = np.nanmax(values, axis=0) if len(values) else np.full(len(numeric_cols), np.nan)
+        numeric_index = {col: idx for idx, col in enumerate(numeric_cols)}
+
         for col in df.columns:
-            dtype = str(df[col].dtype)
-            missing_count = df[col].isnull().sum()
-            unique_count = df[col].nunique()
+            missing_count = missing_by_column[col]
 
             var_info = {
-                "type": dtype,
+                "type": str(df[col].dtype),
                 "n_missing": missing_count,
-                "n_unique": unique_count,
+                "n_unique": unique_by_column[col],
                 "p_missing": round((missing_count / len(df)) * 100, 2)
             }
 
             # Add type-specific info
-            if pd.api.types.is_numeric_dtype(df[col]):
-                non_null = df[col].dropna()
-                if len(non_null) > 0:
-                    var_info.update({
-                        "mean": float(non_null.mean()),
-                        "std": float(non_null.std()),
-                        "min": float(non_null.min()),
-                        "max": float(non_null.max()),
-                        "25%": float(non_null.quantile(0.25)),
-                        "50%": float(non_null.quantile(0.5)),
-                        "75%": float(non_null.quantile(0.75))
-                    })
+            idx = numeric_index.get(col)
+            if idx is not None and stats["count"][idx] > 0:
+                var_info.update({
+                    "mean": float(stats["mean"][idx]),
+                    "std": float(stats["std"][idx]),
+                    "min": float(minimums[idx]),
+                    "max": float(maximums[idx]),
+                    "25%": float(quartiles[0][idx]),
+                    "50%": float(quartiles[1][idx]),
+                    "75%": float(quartiles[2][idx])
+                })
 
             profile["variables"][col] = var_info
 
@@ -437,7 +578,7 @@ class EDAService:
 
         # Load dataframe
         file_obj = storage.download_stream(dataset.storage_key)
-        df = pd.read_csv(file_obj)
+        df = read_frame(dataset.storage_key, file_obj)
 
         # Basic stats
         total_rows = len(df)
@@ -579,7 +720,7 @@ class EDAService:
         # Save to storage
         storage_key = f"eda/advanced_{project_id}_{uuid.uuid4()}.json"
         import io
-        storage.upload_fileobj(storage_key, io.BytesIO(json.dumps(advanced_report).encode('utf-8')))
+        storage.upload_fileobj(storage_key, io.BytesIO(orjson.dumps(advanced_report, option=EDA_JSON_OPTIONS)))
 
         # Store in database
         eda_report_db = EDAReport(
@@ -23,10 +23,25 @@ import json
 import uuid
 import pickle
 import io
+import joblib
+from functools import lru_cache
 from app.db.models import Project as ProjectModel, Dataset, ProjectDataset, ModelMeta, Run
 from app.storage import storage
+from app.utils.tabular import read_frame
 
 class MLService:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def load_model(storage_key: str):
+        """
+        Load a trained model from storage, memoized per storage key.
+        Model artifacts are written once under unique keys, so cached estimators never go stale.
+        """
+        model_file = storage.get_object(storage_key)
+        if hasattr(model_file, "read"):
+            return joblib.load(model_file)
+        return joblib.load(io.BytesIO(model_file))  # type: ignore
+
     @staticmethod
     def _safe_float(value):
         """Convert to float, handling NaN and other missing values"""
@@ -219,7 +234,7 @@ class MLService:
         for dataset in datasets:
             try:
                 file_obj = storage.download_stream(dataset.storage_key)
-                df = pd.read_csv(file_obj)
+                df = read_frame(dataset.storage_key, file_obj)
                 dfs.append(df)
             except Exception as e:
                 print(f"Error loading dataset {dataset.id}: {e}")
@@ -960,8 +975,7 @@ class MLService:
         """
         try:
             # Load model
-            model_file = storage.download_stream(model_meta.storage_key)
-            model = pickle.load(model_file)  # type: ignore
+            model = MLService.load_model(model_meta.storage_key)
 
             # Prepare input data
             input_df = pd.DataFrame(input_data)
@@ -1,10 +1,11 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.sql import func
 from typing import List, Dict, Any, Optional
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import json
+import orjson
 import io
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
@@ -17,6 +18,90 @@ import seaborn as sns
 from app.db.models import Project, Dataset, ProjectDataset, Run, ModelMeta, Artifact
 from app.storage import storage
 from app.services.ml_service import MLService
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import Counter
+
+# EDA artifacts are fetched from storage in parallel, one request per dataset
+EDA_FETCH_MAX_WORKERS = 16
+EDA_CACHE_SIZE = 256
+
+def _loads_eda(content) -> Dict[str, Any]:
+    # orjson takes bytes or str without decoding first; older artifacts may hold NaN/Infinity
+    # tokens or a non-UTF-8 encoding it rejects, which the stdlib parser still accepts
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return json.loads(content)
+
+@lru_cache(maxsize=EDA_CACHE_SIZE)
+def _cached_eda_json(eda_key: str, version: str) -> Dict[str, Any]:
+    return ReportService._fetch_eda_json(eda_key)
+
+# PDF styles are built once; only the theme-coloured ones vary per report, and those are
+# cached per requested colour. Reports read these objects but never modify them.
+DEFAULT_THEME_COLOR = '#1e3a8a'  # navy blue
+PDF_THEME_CACHE_SIZE = 32
+
+_STYLES = getSampleStyleSheet()
+
+def _table_style(theme_color, header_font_size: int) -> TableStyle:
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), theme_color),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0'))
+    ])
+
+@lru_cache(maxsize=PDF_THEME_CACHE_SIZE)
+def _themed_pdf_styles(primary_color: Optional[str]) -> Dict[str, Any]:
+    # Parse primary theme color
+    theme_color = colors.HexColor(DEFAULT_THEME_COLOR)
+    if primary_color:
+        try:
+            color_str = primary_color if primary_color.startswith('#') else f"#{primary_color}"
+            theme_color = colors.HexColor(color_str)
+        except Exception:
+            theme_color = colors.HexColor(DEFAULT_THEME_COLOR)
+
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=_STYLES['Heading1'],
+            fontSize=24,
+            textColor=theme_color,
+            spaceAfter=15,
+            alignment=1  # Center
+        ),
+        "h2": ParagraphStyle(
+            'CustomHeading2',
+            parent=_STYLES['Heading2'],
+            textColor=theme_color,
+            spaceBefore=15,
+            spaceAfter=8
+        ),
+        "h3": ParagraphStyle(
+            'CustomHeading3',
+            parent=_STYLES['Heading3'],
+            textColor=theme_color,
+            spaceBefore=10,
+            spaceAfter=6
+        ),
+        "company": ParagraphStyle(
+            'CompanyBranding',
+            parent=_STYLES['Normal'],
+            fontSize=12,
+            textColor=theme_color,
+            spaceAfter=15,
+            alignment=1  # Center
+        ),
+        "dataset_table": _table_style(theme_color, 14),
+        "model_table": _table_style(theme_color, 12)
+    }
 
 class ReportService:
     @staticmethod
@@ -33,8 +118,12 @@ class ReportService:
         """
         Generate a comprehensive report for a project including EDA and model results
         """
-        # Verify project ownership
-        project = db.query(Project).filter(
+        # Verify project ownership, loading its runs in the same query and its dataset links
+        # (with datasets) and the runs' models in one batched query each
+        project = db.query(Project).options(
+            joinedload(Project.runs).selectinload(Run.model_metas),
+            selectinload(Project.project_datasets).joinedload(ProjectDataset.dataset).defer(Dataset.summary_stats_json)
+        ).filter(
             Project.id == project_id,
             Project.user_id == user_id
         ).first()
@@ -42,17 +131,14 @@ class ReportService:
             raise ValueError("Project not found")
 
         # Get project datasets
-        datasets = db.query(Dataset).join(ProjectDataset).filter(
-            ProjectDataset.project_id == project_id,
-            Dataset.user_id == user_id
-        ).all()
+        datasets = [link.dataset for link in project.project_datasets if link.dataset.user_id == user_id]
 
         if not datasets:
             raise ValueError("No datasets found for this project")
 
         # Get runs and models
-        runs = db.query(Run).filter(Run.project_id == project_id).all()
-        models = db.query(ModelMeta).join(Run).filter(Run.project_id == project_id).all()
+        runs = list(project.runs)
+        models = [model for run in runs for model in run.model_metas]
 
         if not runs:
             # Create a placeholder run for report metadata link
@@ -156,63 +242,87 @@ class ReportService:
             "available_analyses": [],
             "key_insights": []
         }
+        if not datasets:
+            return eda_summary
 
-        for dataset in datasets:
-            # Look for EDA artifacts
-            eda_key = f"eda/{dataset.id}_eda.json"
-            try:
-                eda_data = storage.get_object(eda_key)
-                if hasattr(eda_data, 'read'):
-                    # File-like object
-                    eda_content = eda_data.read()
-                    if isinstance(eda_content, bytes):
-                        eda_json = json.loads(eda_content.decode('utf-8'))
-                    else:
-                        eda_json = json.loads(eda_content)
-                elif isinstance(eda_data, bytes):
-                    # Direct bytes
-                    eda_json = json.loads(eda_data.decode('utf-8'))
-                else:
-                    # Try to read if it's an IO object without read method, or convert to string
-                    try:
-                        # Check if it's an IO object that needs reading
-                        if hasattr(eda_data, '__iter__') and hasattr(eda_data, 'seek'):
-                            eda_data.seek(0)  # Reset to beginning
-                            content = eda_data.read()
-                            if isinstance(content, bytes):
-                                eda_json = json.loads(content.decode('utf-8'))
-                            else:
-                                eda_json = json.loads(content)
-                        else:
-                            # Assume it's already a string or can be converted
-                            eda_json = json.loads(str(eda_data))
-                    except Exception:
-                        # Last resort: try to decode as bytes
-                        if isinstance(eda_data, bytes):
-                            eda_json = json.loads(eda_data.decode('utf-8'))
-                        else:
-                            raise
-
-                eda_summary["available_analyses"].append({
-                    "dataset_id": dataset.id,
-                    "dataset_name": dataset.filename,
-                    "analysis_type": "comprehensive_eda",
-                    "key_findings": eda_json.get("key_findings", [])
-                })
-
-                # Extract key insights
-                if "summary_stats" in eda_json:
-                    numeric_cols = eda_json["summary_stats"].get("numeric_columns", [])
-                    categorical_cols = eda_json["summary_stats"].get("categorical_columns", [])
-
-                    insight = f"Dataset {dataset.filename}: {len(numeric_cols)} numeric, {len(categorical_cols)} categorical columns"
-                    eda_summary["key_insights"].append(insight)
-
-            except Exception as e:
-                print(f"Could not load EDA for dataset {dataset.id}: {e}")
+        # Fetch every dataset's EDA artifact concurrently; summarizing stays sequential and
+        # in dataset order
+        with ThreadPoolExecutor(max_workers=min(EDA_FETCH_MAX_WORKERS, len(datasets))) as executor:
+            eda_results = list(executor.map(ReportService._try_load_eda_json, [d.id for d in datasets]))
+
+        for dataset, eda_json in zip(datasets, eda_results):
+            if isinstance(eda_json, Exception):
+                print(f"Could not load EDA for dataset {dataset.id}: {eda_json}")
+                continue
+
+            eda_summary["available_analyses"].append({
+                "dataset_id": dataset.id,
+                "dataset_name": dataset.filename,
+                "analysis_type": "comprehensive_eda",
+                "key_findings": eda_json.get("key_findings", [])
+            })
+
+            # Extract key insights
+            if "summary_stats" in eda_json:
+                numeric_cols = eda_json["summary_stats"].get("numeric_columns", [])
+                categorical_cols = eda_json["summary_stats"].get("categorical_columns", [])
+
+                insight = f"Dataset {dataset.filename}: {len(numeric_cols)} numeric, {len(categorical_cols)} categorical columns"
+                eda_summary["key_insights"].append(insight)
 
         return eda_summary
 
+    @staticmethod
+    def _try_load_eda_json(dataset_id: str):
+        """The dataset's parsed EDA artifact, or the exception that prevented loading it"""
+        try:
+            return ReportService._load_eda_json(dataset_id)
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def _load_eda_json(dataset_id: str) -> Dict[str, Any]:
+        """
+        Parsed EDA artifact of a dataset, memoized per object version so regenerated reports
+        skip the download and parse. The cached dict is shared, so callers must not mutate it.
+        """
+        # Look for EDA artifacts
+        eda_key = f"eda/{dataset_id}_eda.json"
+        try:
+            version = storage.etag(eda_key)
+        except Exception:
+            # No version to key the cache on; read the object directly
+            return ReportService._fetch_eda_json(eda_key)
+        return _cached_eda_json(eda_key, version)
+
+    @staticmethod
+    def _fetch_eda_json(eda_key: str) -> Dict[str, Any]:
+        """Download and parse a stored EDA artifact"""
+        eda_data = storage.get_object(eda_key)
+        if hasattr(eda_data, 'read'):
+            # File-like object
+            eda_json = _loads_eda(eda_data.read())
+        elif isinstance(eda_data, bytes):
+            # Direct bytes
+            eda_json = _loads_eda(eda_data)
+        else:
+            # Try to read if it's an IO object without read method, or convert to string
+            try:
+                # Check if it's an IO object that needs reading
+                if hasattr(eda_data, '__iter__') and hasattr(eda_data, 'seek'):
+                    eda_data.seek(0)  # Reset to beginning
+                    eda_json = _loads_eda(eda_data.read())
+                else:
+                    # Assume it's already a string or can be converted
+                    eda_json = _loads_eda(str(eda_data))
+            except Exception:
+                # Last resort: try to decode as bytes
+                if isinstance(eda_data, bytes):
+                    eda_json = _loads_eda(eda_data)
+                else:
+                    raise
+        return eda_json
+
     @staticmethod
     def _summarize_models(models: List[ModelMeta], runs: List[Run]) -> Dict[str, Any]:
         """Summarize model training results"""
@@ -223,12 +333,11 @@ class ReportService:
             "performance_metrics": []
         }
 
-        best_score = -float('inf')
-        best_model_info = None
+        runs_by_id = {run.id: run for run in runs}
 
         for model in models:
             # Get run info
-            run = next((r for r in runs if r.id == model.run_id), None)
+            run = runs_by_id.get(model.run_id)
             if not run:
                 continue
 
@@ -243,17 +352,17 @@ class ReportService:
 
             model_summary["performance_metrics"].append(model_info)
 
-            # Track model types
-            model_type = model.name.split()[0]  # Extract base model type
-            model_summary["model_types"][model_type] = model_summary["model_types"].get(model_type, 0) + 1
-
-            # Find best model (assuming higher score is better)
-            primary_score = model.metrics_json.get("score", 0) if model.metrics_json else 0
-            if primary_score > best_score:
-                best_score = primary_score
-                best_model_info = model_info
+        # Track model types (base type is the first word of the name)
+        model_summary["model_types"] = dict(
+            Counter(info["name"].split()[0] for info in model_summary["performance_metrics"])
+        )
 
-        model_summary["best_model"] = best_model_info
+        # Find best model (assuming higher score is better; the first one wins ties)
+        model_summary["best_model"] = max(
+            model_summary["performance_metrics"],
+            key=lambda info: info["metrics"].get("score", 0),
+            default=None
+        )
 
         return model_summary
 
@@ -267,56 +376,17 @@ class ReportService:
         """Generate PDF report"""
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
-        styles = getSampleStyleSheet()
+        styles = _STYLES
+        themed = _themed_pdf_styles(primary_color)
+        title_style = themed["title"]
+        h2_style = themed["h2"]
+        h3_style = themed["h3"]
         story = []
 
-        # Parse primary theme color
-        theme_color = colors.HexColor('#1e3a8a')  # default navy blue
-        if primary_color:
-            try:
-                color_str = primary_color if primary_color.startswith('#') else f"#{primary_color}"
-                theme_color = colors.HexColor(color_str)
-            except Exception:
-                theme_color = colors.HexColor('#1e3a8a')
-
-        # Define styles using the theme color
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=theme_color,
-            spaceAfter=15,
-            alignment=1  # Center
-        )
-
-        h2_style = ParagraphStyle(
-            'CustomHeading2',
-            parent=styles['Heading2'],
-            textColor=theme_color,
-            spaceBefore=15,
-            spaceAfter=8
-        )
-
-        h3_style = ParagraphStyle(
-            'CustomHeading3',
-            parent=styles['Heading3'],
-            textColor=theme_color,
-            spaceBefore=10,
-            spaceAfter=6
-        )
-
         story.append(Paragraph(f"Project Report: {project.name}", title_style))
 
         if company_name:
-            company_style = ParagraphStyle(
-                'CompanyBranding',
-                parent=styles['Normal'],
-                fontSize=12,
-                textColor=theme_color,
-                spaceAfter=15,
-                alignment=1  # Center
-            )
-            story.append(Paragraph(f"PREPARED BY / FOR: {company_name.upper()}", company_style))
+            story.append(Paragraph(f"PREPARED BY / FOR: {company_name.upper()}", themed["company"]))
 
         story.append(Spacer(1, 12))
 
@@ -347,16 +417,7 @@ class ReportService:
             ])
 
         table = Table(dataset_data)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), theme_color),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0'))
-        ]))
+        table.setStyle(themed["dataset_table"])
         story.append(table)
         story.append(Spacer(1, 12))
 
@@ -397,16 +458,7 @@ class ReportService:
                 ])
 
             model_table = Table(model_data)
-            model_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), theme_color),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0'))
-            ]))
+            model_table.setStyle(themed["model_table"])
             story.append(model_table)
 
         # Footer
@@ -417,10 +469,10 @@ class ReportService:
         # Build PDF
         doc.build(story)
 
-        # Save to storage
+        # Save to storage, streaming from the document buffer rather than a bytes copy of it
         buffer.seek(0)
         report_key = f"reports/project_{project.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        storage.put_object(report_key, buffer.read())
+        storage.upload_fileobj(report_key, buffer)
 
         return report_key
 
@@ -446,7 +498,9 @@ class ReportService:
             </div>
             """
 
-        html_content = f"""
+        # Fragments are collected and joined once, keeping assembly linear in the report size
+        parts = []
+        parts.append(f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -495,84 +549,84 @@ class ReportService:
                             <tr><th>Filename</th><th>Rows</th><th>Columns</th><th>Size</th></tr>
                         </thead>
                         <tbody>
-        """
+        """)
 
         for ds in report_data["datasets_summary"]["datasets"]:
-            html_content += f"""
+            parts.append(f"""
                             <tr>
                                 <td>{ds['filename']}</td>
                                 <td>{ds.get('rows', 'N/A')}</td>
                                 <td>{ds.get('cols', 'N/A')}</td>
                                 <td>{ds.get('size', 'N/A')}</td>
                             </tr>
-            """
+            """)
 
-        html_content += """
+        parts.append("""
                         </tbody>
                     </table>
                 </div>
-        """
+        """)
 
         # Add EDA section if available
         if report_data.get("eda_results") and "available_analyses" in report_data["eda_results"]:
-            html_content += """
+            parts.append("""
             <div class="section">
                 <h2>Exploratory Data Analysis</h2>
-            """
+            """)
             for analysis in report_data["eda_results"]["available_analyses"]:
-                html_content += f"""
+                parts.append(f"""
                 <h3>Dataset: {analysis['dataset_name']}</h3>
                 <ul>
-                """
+                """)
                 for finding in analysis.get("key_findings", []):
-                    html_content += f"<li>{finding}</li>"
-                html_content += "</ul>"
-            html_content += "</div>"
+                    parts.append(f"<li>{finding}</li>")
+                parts.append("</ul>")
+            parts.append("</div>")
 
         # Add model results if available
         if report_data.get("model_results") and "performance_metrics" in report_data["model_results"]:
-            html_content += """
+            parts.append("""
             <div class="section">
                 <h2>Model Performance</h2>
-            """
+            """)
 
             best_model = report_data["model_results"]["best_model"]
             if best_model:
-                html_content += f"""
+                parts.append(f"""
                 <div class="metric">
                     <h3 style="margin-top: 0; margin-bottom: 10px;">Best Performing Model</h3>
                     <strong>Model:</strong> {best_model['name']}<br>
                     <strong>Score:</strong> {best_model['metrics'].get('score', 'N/A')}<br>
                     <strong>Created:</strong> {best_model['created_at']}
                 </div>
-                """
+                """)
 
-            html_content += """
+            parts.append("""
                 <h3>Model Comparison</h3>
                 <table class="table">
                     <thead>
                         <tr><th>Model Name</th><th>Primary Score</th><th>Status</th><th>Created</th></tr>
                     </thead>
                     <tbody>
-            """
+            """)
 
             for model in report_data["model_results"]["performance_metrics"]:
-                html_content += f"""
+                parts.append(f"""
                         <tr>
                             <td>{model['name']}</td>
                             <td>{model['metrics'].get('score', 'N/A')}</td>
                             <td>{model.get('run_status', 'N/A')}</td>
                             <td>{model['created_at'][:10]}</td>
                         </tr>
-                """
+                """)
 
-            html_content += """
+            parts.append("""
                     </tbody>
                 </table>
             </div>
-        """
+        """)
 
-        html_content += f"""
+        parts.append(f"""
                 <div class="footer">
                     Report generated automatically by Universal Analyst Model Platform.<br>
                     &copy; {datetime.now().year} {company_name if company_name else "Universal Analyst"}. All rights reserved.
@@ -580,10 +634,10 @@ class ReportService:
             </div>
         </body>
         </html>
-        """
+        """)
 
         # Save to storage
         report_key = f"reports/project_{project.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        storage.put_object(report_key, html_content.encode('utf-8'))
+        storage.upload_fileobj(report_key, io.BytesIO("".join(parts).encode('utf-8')))
 
         return report_key
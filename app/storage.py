@@ -1,4 +1,5 @@
 import os
+import shutil
 from abc import ABC, abstractmethod
 from typing import BinaryIO, Optional, IO, cast
 from datetime import timedelta
@@ -33,6 +34,11 @@ class StorageBackend(ABC):
     def list_prefix(self, prefix: str) -> list[str]:
         pass
 
+    @abstractmethod
+    def etag(self, key: str) -> str:
+        """Opaque version tag of an object; changes whenever the object is rewritten"""
+        pass
+
     @abstractmethod
     def delete_file(self, key: str) -> None:
         pass
@@ -47,7 +53,7 @@ class LocalStorage(StorageBackend):
         path = os.path.join(self.base_path, key)
         os.makedirs(os.path.dirname(path), exist_ok=True)
         with open(path, 'wb') as f:
-            f.write(fileobj.read())
+            shutil.copyfileobj(fileobj, f)
         return key
 
     def put_object(self, key: str, data: bytes, metadata: Optional[dict] = None) -> str:
@@ -69,12 +75,27 @@ class LocalStorage(StorageBackend):
         path = os.path.join(self.base_path, key)
         return open(path, 'rb')
 
+    def etag(self, key: str) -> str:
+        stat = os.stat(os.path.join(self.base_path, key))
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     def list_prefix(self, prefix: str) -> list[str]:
         path = os.path.join(self.base_path, prefix)
-        if not os.path.exists(path):
+        if not os.path.isdir(path):
             return []
-        return [os.path.relpath(os.path.join(root, file), self.base_path)
-                for root, dirs, files in os.walk(path) for file in files]
+        # Entry paths all start with base_path, so keys are a slice away; DirEntry type
+        # checks reuse what the directory listing returned instead of stat-ing each file
+        strip = len(os.path.join(self.base_path, ""))
+        keys = []
+        pending = [path]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        keys.append(entry.path[strip:])
+                    elif not entry.is_symlink():
+                        pending.append(entry.path)
+        return keys
 
     def delete_file(self, key: str) -> None:
         path = os.path.join(self.base_path, key)
@@ -124,6 +145,9 @@ class S3MinIOClient(StorageBackend):
         response = self.client.get_object(Bucket=self.bucket, Key=key)
         return response['Body']
 
+    def etag(self, key: str) -> str:
+        return self.client.head_object(Bucket=self.bucket, Key=key)['ETag']
+
     def list_prefix(self, prefix: str) -> list[str]:
         response = self.client.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
         if 'Contents' not in response:
@@ -0,0 +1,64 @@
+import logging
+import time
+from typing import Any, Optional
+import orjson
+import redis
+from app.config import settings
+
+logger = logging.getLogger("uam-cache")
+
+# Results cache shared by validation and EDA. Redis being down must never fail a request,
+# so every call degrades to a miss and connection attempts back off for a while.
+# Values are stored as orjson writes them; anything it cannot encode faithfully is not
+# cached at all, so a hit always returns what the miss computed.
+RESULT_CACHE_TTL_SECONDS = 3600
+_RETRY_AFTER_SECONDS = 30.0
+
+_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+_client: Optional[redis.Redis] = None
+_unavailable_until = 0.0
+
+def _get_client() -> Optional[redis.Redis]:
+    global _client
+    if time.monotonic() < _unavailable_until:
+        return None
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=1, socket_connect_timeout=1)
+    return _client
+
+def _mark_unavailable(exc: Exception) -> None:
+    global _unavailable_until
+    logger.warning("Result cache unavailable: %s", exc)
+    _unavailable_until = time.monotonic() + _RETRY_AFTER_SECONDS
+
+def get_cached_json(key: str) -> Optional[Any]:
+    client = _get_client()
+    if client is None:
+        return None
+    try:
+        raw = client.get(key)
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+        return None
+    if raw is None:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # e.g. entries written before the switch to orjson, with NaN tokens in them
+        return None
+
+def set_cached_json(key: str, value: Any, ttl_seconds: int = RESULT_CACHE_TTL_SECONDS) -> None:
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        payload = orjson.dumps(value, option=_DUMPS_OPTIONS)
+    except (TypeError, orjson.JSONEncodeError) as e:
+        logger.warning("Not caching %s: value is not JSON-serializable: %s", key, e)
+        return
+    try:
+        client.setex(key, ttl_seconds, payload)
+    except redis.RedisError as e:
+        _mark_unavailable(e)
@@ -0,0 +1,14 @@
+import hashlib
+from typing import Optional
+from fastapi import Request, Response, status
+
+def check_etag(request: Request, response: Response, *fingerprint) -> Optional[Response]:
+    """
+    Derive a weak ETag from a cheap fingerprint of the data behind a response.
+    Returns a 304 response when the client already holds the current version.
+    """
+    etag = 'W/"%s"' % hashlib.md5("|".join(str(part) for part in fingerprint).encode()).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
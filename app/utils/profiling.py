@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+# ydata-profiling runs in a child interpreter so a crash, runaway allocation or hang takes
+# down only that process. The frame is handed over as an Arrow IPC file the child memory-maps.
+PROFILE_TIMEOUT_SECONDS = 120
+PROFILE_MEMORY_LIMIT_BYTES = 4 << 30
+PROFILE_STDERR_TAIL_CHARS = 2000
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+def _limit_memory() -> None:
+    import resource
+    resource.setrlimit(resource.RLIMIT_AS, (PROFILE_MEMORY_LIMIT_BYTES, PROFILE_MEMORY_LIMIT_BYTES))
+
+def profile_dataframe(df: pd.DataFrame, title: str, timeout: float = PROFILE_TIMEOUT_SECONDS) -> Dict[str, Any]:
+    """
+    Build a minimal ydata-profiling report for df in a separate process.
+    Raises subprocess.TimeoutExpired when profiling does not finish in time, or RuntimeError
+    carrying the tail of the child's stderr when it fails or is killed.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with tempfile.TemporaryDirectory(prefix="uam-profile-") as tmp:
+        in_path = os.path.join(tmp, "frame.arrow")
+        out_path = os.path.join(tmp, "profile.json")
+        with pa.OSFile(in_path, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        del table
+
+        # The memory limit is applied by the child itself (see _main): preexec_fn is not
+        # safe in a parent that runs threads, as the EDA worker and request handlers do
+        completed = subprocess.run(
+            [sys.executable, "-m", "app.utils.profiling", in_path, out_path, title],
+            cwd=_PROJECT_ROOT,
+            timeout=timeout,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        if completed.returncode != 0:
+            stderr_tail = completed.stderr.decode("utf-8", errors="replace")[-PROFILE_STDERR_TAIL_CHARS:]
+            raise RuntimeError(f"Profiling process exited with code {completed.returncode}: {stderr_tail}")
+        with open(out_path, "rb") as f:
+            return orjson.loads(f.read())
+
+def _main(in_path: str, out_path: str, title: str) -> None:
+    if os.name == "posix":
+        _limit_memory()
+    from ydata_profiling import ProfileReport
+    with pa.memory_map(in_path) as source:
+        df = ipc.open_file(source).read_all().to_pandas()
+    profile = ProfileReport(
+        df,
+        title=title,
+        explorative=True,
+        minimal=True,  # Use minimal mode to avoid complex computations
+        # Samples, correlations, interactions, missing diagrams and duplicates are
+        # either unused or already computed by EDAService._generate_insights
+        samples=None,
+        correlations=None,
+        interactions=None,
+        missing_diagrams=None,
+        duplicates=None
+    )
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(profile.to_json())
+
+if __name__ == "__main__":
+    _main(*sys.argv[1:4])
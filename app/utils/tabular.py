@@ -0,0 +1,133 @@
+from typing import IO, Callable, Iterator
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# CSV parsing through pyarrow's multithreaded reader. Arrow rejects some files pandas
+# tolerates (ragged rows, a column whose type changes after the first block), so callers
+# pass a factory that reopens the stream and the pandas parser gets a second attempt.
+# Frames keep NumPy dtypes; USE_ARROW_CSV = False sends whole-file reads to pandas' parser.
+# Arrow also infers dates and timestamps, which pandas leaves as text and which the model
+# and profiling code does not expect, so temporal columns are read back as strings.
+USE_ARROW_CSV = True
+ARROW_BLOCK_SIZE = 8 << 20
+PARQUET_BATCH_ROWS = 100_000
+
+def _read_options() -> pacsv.ReadOptions:
+    return pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE, use_threads=True)
+
+def _convert_options(column_types=None) -> pacsv.ConvertOptions:
+    # Empty and "NA"-style cells in text columns are missing values, as with pandas
+    return pacsv.ConvertOptions(strings_can_be_null=True, column_types=column_types)
+
+def _temporal_columns(schema: pa.Schema) -> dict:
+    return {field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)}
+
+def _arrow_read_csv(open_source: Callable[[], IO[bytes]]) -> pa.Table:
+    """
+    Parse a whole CSV with Arrow, keeping date/time columns as their original text.
+    Those are rare, so their files are parsed a second time with the columns pinned to string
+    rather than cast (a cast would rewrite the text, e.g. "T" separators and fractions).
+    """
+    table = pacsv.read_csv(open_source(), read_options=_read_options(), convert_options=_convert_options())
+    temporal = _temporal_columns(table.schema)
+    if not temporal:
+        return table
+    del table
+    return pacsv.read_csv(open_source(), read_options=_read_options(), convert_options=_convert_options(temporal))
+
+def _temporal_as_text(batch: pa.RecordBatch) -> pa.RecordBatch:
+    # Streamed batches cannot be re-read, so inferred date/time columns are cast back to text
+    temporal = _temporal_columns(batch.schema)
+    if not temporal:
+        return batch
+    return pa.RecordBatch.from_arrays(
+        [column.cast(pa.string()) if name in temporal else column for name, column in zip(batch.schema.names, batch.columns)],
+        names=batch.schema.names
+    )
+
+def _seekable(file_obj: IO[bytes]):
+    """Parquet readers seek to the footer; buffer streams that cannot (S3 bodies)"""
+    seekable = getattr(file_obj, "seekable", None)
+    return file_obj if seekable is not None and seekable() else pa.BufferReader(file_obj.read())
+
+def read_parquet(file_obj: IO[bytes]) -> pd.DataFrame:
+    """Read a whole Parquet file into a DataFrame."""
+    return pq.read_table(_seekable(file_obj)).to_pandas(self_destruct=True, split_blocks=True)
+
+def read_parquet_metadata(file_obj: IO[bytes]) -> pq.FileMetaData:
+    """Row count, column count and schema from a Parquet footer, without reading data pages."""
+    return pq.ParquetFile(_seekable(file_obj)).metadata
+
+def read_parquet_head(file_obj: IO[bytes], n: int) -> pd.DataFrame:
+    """First n rows of a Parquet file; only the leading row group's pages are decoded."""
+    parquet_file = pq.ParquetFile(_seekable(file_obj))
+    for batch in parquet_file.iter_batches(batch_size=n):
+        return batch.to_pandas()
+    return parquet_file.schema_arrow.empty_table().to_pandas()
+
+def read_csv(file_obj: IO[bytes]) -> pd.DataFrame:
+    """Read a whole CSV into a DataFrame."""
+    if not USE_ARROW_CSV:
+        return pd.read_csv(file_obj)
+    source = _seekable(file_obj)
+
+    def reopen():
+        source.seek(0)
+        return source
+
+    try:
+        table = _arrow_read_csv(reopen)
+    except pa.ArrowInvalid:
+        source.seek(0)
+        return pd.read_csv(source, low_memory=False)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+def write_parquet(df: pd.DataFrame) -> pa.BufferReader:
+    """
+    Encode df as Snappy-compressed Parquet in an Arrow buffer and return a reader over it,
+    ready to upload without copying the bytes again.
+    Raises pa.ArrowInvalid or pa.ArrowTypeError for columns that have no Arrow type.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="snappy")
+    return pa.BufferReader(sink.getvalue())
+
+def read_frame(name: str, file_obj: IO[bytes]) -> pd.DataFrame:
+    """Read a stored Parquet or CSV file into a DataFrame, picking the format from its name."""
+    if name.lower().endswith('.parquet'):
+        return read_parquet(file_obj)
+    return read_csv(file_obj)
+
+def read_table(name: str, open_stream: Callable[[], IO[bytes]]) -> pa.Table:
+    """Read a stored Parquet or CSV file into an Arrow table, picking the format from its name."""
+    if name.lower().endswith('.parquet'):
+        return pq.read_table(_seekable(open_stream()))
+    return read_csv_table(open_stream)
+
+def read_csv_table(open_stream: Callable[[], IO[bytes]]) -> pa.Table:
+    """Parse a whole CSV into an Arrow table."""
+    try:
+        return _arrow_read_csv(open_stream)
+    except pa.ArrowInvalid:
+        # low_memory=False infers one dtype per column, so the frame always converts to Arrow
+        return pa.Table.from_pandas(pd.read_csv(open_stream(), low_memory=False), preserve_index=False)
+
+def iter_csv_arrow(file_obj: IO[bytes]) -> Iterator[pd.DataFrame]:
+    """
+    Yield a CSV as DataFrame chunks of roughly ARROW_BLOCK_SIZE bytes each.
+    Raises pa.ArrowInvalid part-way through if a later block does not fit the inferred schema.
+    """
+    reader = pacsv.open_csv(file_obj, read_options=_read_options(), convert_options=_convert_options())
+    for batch in reader:
+        yield _temporal_as_text(batch).to_pandas(split_blocks=True)
+
+def iter_parquet(file_obj: IO[bytes], columns=None) -> Iterator[pd.DataFrame]:
+    """
+    Yield a Parquet file as DataFrame chunks of up to PARQUET_BATCH_ROWS rows, optionally
+    reading only some columns.
+    """
+    for batch in pq.ParquetFile(_seekable(file_obj)).iter_batches(batch_size=PARQUET_BATCH_ROWS, columns=columns):
+        yield batch.to_pandas(split_blocks=True)
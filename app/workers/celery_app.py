@@ -21,3 +21,30 @@ celery_app.conf.task_serializer = "json"
 celery_app.conf.result_serializer = "json"
 celery_app.conf.accept_content = ["json"]
 celery_app.conf.result_expires = 3600
+# Keep each task's arguments with its stored state, so status endpoints can check which
+# object a task id belongs to before reporting on it
+celery_app.conf.result_extended = True
+
+# EDA/training payloads are large; compress them on the way through Redis
+celery_app.conf.task_compression = "gzip"
+celery_app.conf.result_compression = "gzip"
+celery_app.conf.result_backend_transport_options = {"global_keyprefix": "uam:"}
+
+# Tasks run for minutes: reserve one at a time, acknowledge only once finished so a
+# crashed worker's task is redelivered, and recycle children to hand pandas memory back
+celery_app.conf.worker_prefetch_multiplier = 1
+celery_app.conf.task_acks_late = True
+celery_app.conf.worker_max_tasks_per_child = 50
+
+# The eda queue is consumed by its own single-process worker (see docker-compose.yml);
+# hard limits stop a runaway profile from holding that worker indefinitely
+TRAIN_TIME_LIMIT_SECONDS = 3600
+celery_app.conf.task_annotations = {
+    "app.workers.tasks.run_eda": {"rate_limit": "4/m", "time_limit": 900, "soft_time_limit": 840},
+    "app.workers.tasks.train_models": {"time_limit": TRAIN_TIME_LIMIT_SECONDS},
+}
+
+# With acks_late, Redis redelivers any message left unacknowledged for visibility_timeout
+# seconds (default 3600) to another worker. It must outlast the longest task time limit,
+# or a long training run is started a second time while the first is still going.
+celery_app.conf.broker_transport_options = {"visibility_timeout": 2 * TRAIN_TIME_LIMIT_SECONDS}
@@ -2,6 +2,7 @@ from celery import shared_task
 from app.db.session import SessionLocal
 from app.db.models import Run, Log, Artifact, Dataset, EDAReport, DataLineage
 from app.storage import storage
+from app.utils.tabular import read_frame
 import pandas as pd
 import joblib
 import os
@@ -82,6 +83,20 @@ def predict_batch_task(self, task_id, model_key, input_file_key, batch_size=1000
         self.update_state(state='FAILURE', meta={'error': str(e)})
         raise
 
+@shared_task(bind=True)
+def clean_dataset_task(self, dataset_id, options, user_id):
+    """
+    Background dataset cleaning. The result is clean_dataset's response (new version number,
+    rows, cols); a ValueError from the service marks the task as failed with its message.
+    """
+    from app.services.dataset_service import DatasetService
+
+    db = SessionLocal()
+    try:
+        return DatasetService.clean_dataset(dataset_id, options, user_id, db)
+    finally:
+        db.close()
+
 def log_message(db, run_id, level, message):
     log = Log(run_id=run_id, level=level, message=message)
     db.add(log)
@@ -101,7 +116,7 @@ def preprocess_data(self, run_id, dataset_key):
 
         # Download dataset from storage
         data_bytes = storage.get_object(dataset_key)
-        df = pd.read_csv(io.BytesIO(data_bytes.read()))  # type: ignore
+        df = read_frame(dataset_key, io.BytesIO(data_bytes.read()))  # type: ignore
 
         # Type-aware imputation strategy to prevent empty datasets from dropping rows
         df_clean = df.copy()
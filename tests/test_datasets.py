@@ -0,0 +1,81 @@
+import io
+import pytest
+from app.utils.limiter import limiter
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    # Each test registers its own user; the whole suite would exceed the signup rate limit
+    monkeypatch.setattr(limiter, "enabled", False)
+
+def _auth_headers(client, email):
+    reg_resp = client.post("/api/auth/register", json={
+        "name": "Dataset Test User",
+        "email": email,
+        "password": "password123"
+    })
+    assert reg_resp.status_code == 200
+    return {"Authorization": f"Bearer {reg_resp.json()['access_token']}"}
+
+def _upload_csv(client, headers, filename, content):
+    return client.post(
+        "/api/datasets/upload",
+        headers=headers,
+        files={"file": (filename, io.BytesIO(content), "text/csv")}
+    )
+
+def test_upload_csv_with_date_column(client):
+    headers = _auth_headers(client, "test_dates@example.com")
+
+    # Arrow parses ISO dates into datetime.date objects, which must not end up as JSON keys
+    resp = _upload_csv(client, headers, "dates.csv", b"d,x\n2024-01-01,1\n2024-01-02,2\n2024-01-01,3\n")
+    assert resp.status_code == 200
+    dataset_id = resp.json()["id"]
+
+    summary_resp = client.get(f"/api/datasets/{dataset_id}/summary", headers=headers)
+    assert summary_resp.status_code == 200
+
+    preview_resp = client.get(f"/api/datasets/{dataset_id}/preview", headers=headers)
+    assert preview_resp.status_code == 200
+    assert preview_resp.json()["columns"] == ["d", "x"]
+
+class _FakeAsyncResult:
+    def __init__(self, state, kwargs=None, result=None, info=None):
+        self.state = state
+        self.kwargs = kwargs
+        self.result = result
+        self.info = info
+
+def _fake_task(monkeypatch, task):
+    import app.routers.datasets as datasets_router
+    monkeypatch.setattr(datasets_router, "AsyncResult", lambda task_id, app=None: task)
+
+def test_clean_status_reports_task_outcome(client, monkeypatch):
+    headers = _auth_headers(client, "test_clean_status@example.com")
+    dataset_id = _upload_csv(client, headers, "clean.csv", b"a,b\n1,2\n3,4\n").json()["id"]
+    task_kwargs = {"dataset_id": dataset_id, "options": {}, "user_id": "u"}
+
+    _fake_task(monkeypatch, _FakeAsyncResult("SUCCESS", task_kwargs, result={"dataset_id": dataset_id, "rows": 2}))
+    resp = client.get(f"/api/datasets/{dataset_id}/clean/task-1", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "SUCCESS"
+    assert resp.json()["result"]["rows"] == 2
+
+    _fake_task(monkeypatch, _FakeAsyncResult("FAILURE", task_kwargs, info=ValueError("Dataset not found")))
+    resp = client.get(f"/api/datasets/{dataset_id}/clean/task-1", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "FAILURE"
+    assert resp.json()["error"] == "Dataset not found"
+
+def test_clean_status_hides_other_datasets_tasks(client, monkeypatch):
+    headers = _auth_headers(client, "test_clean_foreign@example.com")
+    dataset_id = _upload_csv(client, headers, "mine.csv", b"a,b\n1,2\n").json()["id"]
+    foreign_kwargs = {"dataset_id": "someone-elses-dataset", "options": {}, "user_id": "u"}
+
+    for task in (
+        _FakeAsyncResult("SUCCESS", foreign_kwargs, result={"dataset_id": "someone-elses-dataset"}),
+        _FakeAsyncResult("FAILURE", foreign_kwargs, info=ValueError("secret detail")),
+    ):
+        _fake_task(monkeypatch, task)
+        resp = client.get(f"/api/datasets/{dataset_id}/clean/task-2", headers=headers)
+        assert resp.status_code == 404
+        assert "secret detail" not in resp.text
@@ -0,0 +1,21 @@
+import io
+from sklearn.linear_model import LinearRegression
+from app.services.ml_service import MLService
+from app.utils.tabular import read_frame
+
+def _timestamped_csv(rows=60):
+    lines = ["ts,day,x,y"]
+    for i in range(rows):
+        lines.append(f"2024-01-{i % 28 + 1:02d} {i % 24:02d}:00:00,2024-02-{i % 28 + 1:02d},{i},{2 * i + 1}")
+    return ("\n".join(lines) + "\n").encode()
+
+def test_read_frame_keeps_dates_as_text():
+    df = read_frame("datasets/dates.csv", io.BytesIO(_timestamped_csv()))
+    assert df["ts"].iloc[0] == "2024-01-01 00:00:00"
+    assert df["day"].iloc[0] == "2024-02-01"
+    assert not any(str(dtype).startswith(("datetime", "date")) for dtype in df.dtypes)
+
+def test_training_on_csv_with_timestamp_column():
+    df = read_frame("datasets/dates.csv", io.BytesIO(_timestamped_csv()))
+    X, y, _ = MLService._prepare_data(df, "y", "regression")
+    LinearRegression().fit(X, y)